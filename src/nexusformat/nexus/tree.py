@@ -188,6 +188,7 @@ may vary from call to call, so this is mainly useful in iterative searches.
 __all__ = ['NXFile', 'NXobject', 'NXfield', 'NXgroup', 'NXattr',
            'NXvirtualfield', 'NXlink', 'NXlinkfield', 'NXlinkgroup',
            'NeXusError', 'nxgetconfig', 'nxsetconfig',
+           'nxgetcache', 'nxsetcache',
            'nxgetcompression', 'nxsetcompression',
            'nxgetencoding', 'nxsetencoding',
            'nxgetlock', 'nxsetlock',
@@ -199,12 +200,19 @@ __all__ = ['NXFile', 'NXobject', 'NXfield', 'NXgroup', 'NXattr',
            'nxclasses', 'nxload', 'nxopen', 'nxsave', 'nxduplicate', 'nxdir',
            'nxconsolidate', 'nxdemo', 'nxversion']
 
+import math
 import numbers
+import operator
 import os
 import re
+import shutil
 import sys
+import tempfile
+import time
+import uuid
 import warnings
 from copy import copy, deepcopy
+from functools import lru_cache, reduce
 from pathlib import Path
 from pathlib import PurePosixPath as PurePath
 
@@ -218,8 +226,8 @@ from .lock import NXLock, NXLockException
 warnings.simplefilter('ignore', category=FutureWarning)
 
 # Default configuration parameters.
-NX_CONFIG = {'compression': 'gzip', 'encoding': 'utf-8', 'lock': 0,
-             'lockexpiry': 8 * 3600, 'lockdirectory': None,
+NX_CONFIG = {'cache': 16, 'compression': 'gzip', 'encoding': 'utf-8',
+             'lock': 0, 'lockexpiry': 8 * 3600, 'lockdirectory': None,
              'maxsize': 10000, 'memory': 2000, 'recursive': False}
 # These are overwritten below by environment variables if defined.
 
@@ -265,13 +273,16 @@ def text(value):
     UnicodeDecodeError exception, an alternate encoding is tried. Null
     characters are removed from the return value.
     """
-    if isinstance(value, np.ndarray) and value.shape == (1,):
+    if isinstance(value, str):
+        return value.replace('\x00', '').rstrip()
+    elif isinstance(value, np.ndarray) and value.shape == (1,):
         value = value[0]
     if isinstance(value, bytes):
+        encoding = NX_CONFIG['encoding']
         try:
-            _text = value.decode(NX_CONFIG['encoding'])
+            _text = value.decode(encoding)
         except UnicodeDecodeError:
-            if NX_CONFIG['encoding'] == 'utf-8':
+            if encoding == 'utf-8':
                 _text = value.decode('latin-1')
             else:
                 _text = value.decode('utf-8')
@@ -340,6 +351,9 @@ def format_float(value, width=np.get_printoptions()['precision']):
     return re.sub(r"e(-?)0*(\d+)", r"e\1\2", text.replace("e+", "e"))
 
 
+_digits = re.compile(r'(\d+)')
+
+
 def natural_sort(key):
     """Key to sort a list of strings containing numbers in natural order.
 
@@ -356,7 +370,68 @@ def natural_sort(key):
     list
         List of string components splitting embedded numbers as integers.
     """
-    return [int(t) if t.isdigit() else t for t in re.split(r'(\d+)', key)]
+    return list(_natural_key(key))
+
+
+@lru_cache(maxsize=4096)
+def _natural_key(key):
+    """Return a cached natural sort key as a tuple.
+
+    This is used to sort the names in NeXus trees, where the same names
+    recur many times.
+
+    Parameters
+    ----------
+    key : str
+        String in the list to be sorted.
+
+    Returns
+    -------
+    tuple
+        String components splitting embedded numbers as integers.
+    """
+    return tuple(int(t) if t.isdigit() else t for t in _digits.split(key))
+
+
+@lru_cache(maxsize=None)
+def _getclassdir(cls):
+    """Return the public attributes of a class.
+
+    Parameters
+    ----------
+    cls : type
+        Class whose attributes are listed.
+
+    Returns
+    -------
+    frozenset of str
+        Names of class attributes that do not start with an underscore.
+    """
+    return frozenset(c for c in dir(cls) if not c.startswith('_'))
+
+
+def _getplotview():
+    """Return the plotter used by the NXfield and NXdata plot methods.
+
+    A `plotview` defined in the `__main__` namespace, e.g., by NeXpy, takes
+    precedence over the Matplotlib plotter defined in `nexusformat.plot`.
+    It is looked up on each call, since it may be defined after this module
+    has been imported.
+    """
+    try:
+        from __main__ import plotview
+        if plotview is not None:
+            return plotview
+    except ImportError:
+        pass
+    return _getdefaultplotview()
+
+
+@lru_cache(maxsize=1)
+def _getdefaultplotview():
+    """Return the default Matplotlib plotter, importing it once."""
+    from .plot import plotview
+    return plotview
 
 
 class NeXusError(Exception):
@@ -417,6 +492,10 @@ class NXFile:
             entries will be read automatically when they are referenced.
         **kwargs
             Keyword arguments to be used when opening the h5py File object.
+            Unless 'rdcc_nbytes' is specified, the HDF5 chunk cache is set
+            to the size defined by NX_CACHE (in MB), with 100003 hash slots.
+            The chunk cache settings are retained whenever the file is
+            reopened.
         """
         self.h5 = h5
         self.name = str(name)
@@ -430,6 +509,11 @@ class NXFile:
         self._path = '/'
         self._root = None
         self._with_count = 0
+        if 'rdcc_nbytes' not in kwargs:
+            kwargs = {**_getcacheopts(), **kwargs}
+        self._cache = {key: kwargs[key] for key in
+                       ('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0')
+                       if key in kwargs}
         if recursive is None:
             self.recursive = NX_CONFIG['recursive']
         else:
@@ -691,6 +775,7 @@ class NXFile:
         """Open the NeXus file for input/output."""
         if not self.is_open():
             self.acquire_lock()
+            kwargs = {**self._cache, **kwargs}
             if self._mode == 'rw':
                 self._file = self.h5.File(self._filename, 'r+', **kwargs)
             else:
@@ -820,11 +905,9 @@ class NXFile:
         else:
             group = NXgroup(nxclass=nxclass, name=name, attrs=attrs)
         if recursive:
-            children = self._readchildren()
-            group._entries = {}
-            for child in children:
-                group._entries[child] = children[child]
-                children[child]._group = group
+            group._entries = self._readchildren()
+            for child in group._entries.values():
+                child._group = group
         group._changed = True
         return group
 
@@ -1079,6 +1162,7 @@ class NXFile:
                     self[self.nxpath][()] = data._value
             except NeXusError:
                 pass
+        data._h5optpath = None
         self._writeattrs(data.attrs)
         self.nxpath = self.nxparent
         return []
@@ -1177,11 +1261,9 @@ class NXFile:
             A dictionary of all the group entries.
         """
         self.nxpath = group.nxpath
-        children = self._readchildren()
-        _entries = {}
-        for child in children:
-            _entries[child] = children[child]
-            _entries[child]._group = group
+        _entries = self._readchildren()
+        for child in _entries.values():
+            child._group = group
         return _entries
 
     def readvalues(self, attrs=None):
@@ -1342,7 +1424,7 @@ class NXFile:
                 if isinstance(item._copyfile, NXFile):
                     with item._copyfile as f:
                         self.copy(f[item._copypath], item.nxpath,
-                                  **item._attrs)
+                                  **item._copyopts)
                     item = self.readpath(item.nxpath)
                     if self.nxparent == '/':
                         group = self._root
@@ -1624,7 +1706,7 @@ def _getshape(shape, maxshape=False):
             elif None in shape:
                 return None
             else:
-                return tuple([int(i) for i in shape])
+                return tuple(map(int, shape))
         except ValueError:
             raise NeXusError(f"Invalid shape: {shape}")
 
@@ -1684,7 +1766,7 @@ def _checkshape(shape, maxshape):
     bool
         True if the shape is consistent.
     """
-    for i, j in [(_i, _j) for _i, _j in zip(maxshape, shape)]:
+    for i, j in zip(maxshape, shape):
         if i is not None and i < j:
             return False
     return True
@@ -1707,13 +1789,102 @@ def _getsize(shape):
     """
     if shape is None:
         return 1
+    elif isinstance(shape, numbers.Integral):
+        return int(shape)
     else:
         try:
-            return np.prod(shape, dtype=np.int64)
+            return reduce(operator.mul, (int(i) for i in shape), 1)
         except Exception:
             return 1
 
 
+def _getextremum(func, data, infinity, axis=None, **kwargs):
+    """Return the minimum or maximum of an array ignoring NaNs and infinity.
+
+    The array is first reduced directly, without copying it. The reduction
+    is only repeated without the infinite values if the result contains
+    NaN or the infinity to be ignored.
+
+    Parameters
+    ----------
+    func : function
+        Either `np.nanmin` or `np.nanmax`.
+    data : array_like
+        Array to be reduced.
+    infinity : float
+        Infinite value to be ignored, i.e., `-np.inf` or `np.inf`.
+    axis : int or tuple of ints, optional
+        Axis or axes to be reduced, by default all axes.
+
+    Returns
+    -------
+    scalar or ndarray
+        Extreme values of the data.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        result = func(data, axis, **kwargs)
+    if not np.any(np.isnan(result) | (result == infinity)):
+        return result
+    elif axis is None:
+        return func(data[~np.isnan(data) & (data != infinity)], **kwargs)
+    else:
+        return func(np.where(data == infinity, np.nan, data), axis, **kwargs)
+
+
+def _getmoment(y, x, order=1, center=None):
+    """Return the central moment of a one-dimensional distribution.
+
+    Masked values of the distribution are treated as zero.
+
+    Parameters
+    ----------
+    y : array_like
+        Values of the distribution.
+    x : array_like
+        Coordinates of the distribution values.
+    order : int, optional
+        Order of the calculated moment, by default 1.
+    center : float, optional
+        Center if defined externally for use by higher order moments,
+        by default None.
+
+    Returns
+    -------
+    float
+        Value of moment.
+    """
+    y, x = np.ma.filled(y, 0), np.asarray(x)
+    total = y.sum()
+    if center:
+        c = center
+    else:
+        c = np.dot(y, x) / total
+    if order == 1:
+        return c
+    else:
+        return np.dot(y, (x - c)**order) / total
+
+
+def _getcacheopts():
+    """Return the default h5py keyword arguments for the HDF5 chunk cache.
+
+    The number of hash slots is a large prime number, so that there are
+    few collisions between the chunks stored in the cache.
+
+    Returns
+    -------
+    dict
+        Values of 'rdcc_nbytes' and 'rdcc_nslots', or an empty dictionary
+        if the h5py defaults are to be used.
+    """
+    if NX_CONFIG['cache']:
+        return {'rdcc_nbytes': NX_CONFIG['cache'] * 1024 * 1024,
+                'rdcc_nslots': 100003}
+    else:
+        return {}
+
+
 def _readaxes(axes):
     """Return a list of axis names stored in the 'axes' attribute.
 
@@ -1757,6 +1928,7 @@ class AttrDict(dict):
     """
 
     _parent = None
+    _sorted = None
 
     def __init__(self, parent=None, attrs=None):
         super().__init__()
@@ -1767,6 +1939,7 @@ class AttrDict(dict):
     def _setattrs(self, attrs):
         for key, value in attrs.items():
             super().__setitem__(key, NXattr(value))
+        self._sorted = None
 
     def __getitem__(self, key):
         """Returns the value of the requested NXattr object."""
@@ -1785,6 +1958,35 @@ class AttrDict(dict):
             super().__setitem__(text(key), value)
         else:
             super().__setitem__(text(key), NXattr(value))
+        self._sorted = None
+        if isinstance(self._parent, NXobject):
+            self._parent.set_changed()
+            if self._parent.nxfilemode == 'rw':
+                with self._parent.nxfile as f:
+                    f.update(self)
+
+    def update(self, *args, **kwargs):
+        """Creates or replaces multiple entries in the dictionary.
+
+        The parent is marked as changed, and its file updated, only once
+        after all the entries have been assigned.
+        """
+        items = {text(key): value
+                 for key, value in dict(*args, **kwargs).items()
+                 if value is not None}
+        if not items:
+            return
+        elif isinstance(self._parent, NXobject):
+            if self._parent.nxfilemode == 'r':
+                raise NeXusError("NeXus file opened as readonly")
+            elif self._parent.is_linked():
+                raise NeXusError("Cannot modify an item in a linked group")
+        for key, value in items.items():
+            if isinstance(value, NXattr):
+                super().__setitem__(key, value)
+            else:
+                super().__setitem__(key, NXattr(value))
+        self._sorted = None
         if isinstance(self._parent, NXobject):
             self._parent.set_changed()
             if self._parent.nxfilemode == 'rw':
@@ -1799,6 +2001,7 @@ class AttrDict(dict):
             elif self._parent.is_linked():
                 raise NeXusError("Cannot modify an item in a linked group")
         super().__delitem__(key)
+        self._sorted = None
         if isinstance(self._parent, NXobject):
             self._parent.set_changed()
             if self._parent.nxfilemode == 'rw':
@@ -1812,6 +2015,15 @@ class AttrDict(dict):
         else:
             return default
 
+    def sorted_keys(self):
+        """Return the attribute names in sorted order.
+
+        The sorted list is cached until the attributes are modified.
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self)
+        return self._sorted
+
     @property
     def nxpath(self):
         """The path to the NeXus field or group containin the attributes."""
@@ -1904,23 +2116,23 @@ class NXattr:
         -----
         If unmodified values are required, use the 'nxdata' property.
         """
-        if self._value is None:
+        _value = self._value
+        if _value is None:
             return ''
-        elif (self.dtype is not None and
-              (self.dtype.type == np.bytes_ or self.dtype.type == np.str_ or
-               self.dtype == string_dtype)):
-            if self.shape == ():
-                return text(self._value)
-            elif self.shape == (1,):
-                return text(self._value[0])
+        dtype, shape = self._dtype, self.shape
+        if dtype is not None and is_string_dtype(dtype):
+            if shape == ():
+                return text(_value)
+            elif shape == (1,):
+                return text(_value[0])
             else:
-                return [text(value) for value in self._value[()]]
-        elif self.shape == ():
-            return self._value
-        elif self.shape == (1,):
-            return self._value.item()
+                return [text(value) for value in _value[()]]
+        elif shape == ():
+            return _value
+        elif shape == (1,):
+            return _value.item()
         else:
-            return self._value.tolist()
+            return _value.tolist()
 
     @property
     def nxdata(self):
@@ -1941,7 +2153,14 @@ class NXattr:
             return ()
 
 
-_npattrs = list(filter(lambda x: not x.startswith('_'), np.ndarray.__dict__))
+_npattrs = frozenset(x for x in np.ndarray.__dict__ if not x.startswith('_'))
+_pickle_keys = ('_class', '_name', '_group', '_target', '_entries', '_attrs',
+                '_filename', '_mode', '_dtype', '_shape', '_value', '_h5opts',
+                '_changed')
+_CLS_ROOT, _CLS_ENTRY, _CLS_LINK = 1, 2, 4
+_unsafe_attrs = frozenset(('target', 'signal', 'axes'))
+_h5optnames = ('chunks', 'compression', 'compression_opts', 'fillvalue',
+               'fletcher32', 'maxshape', 'scaleoffset', 'shuffle')
 
 
 class NXobject:
@@ -1986,9 +2205,10 @@ class NXobject:
     """
 
     _class = "unknown"
+    _clsflags = 0
     _name = "unknown"
     _group = None
-    _attrs = AttrDict()
+    _attrs = None
     _file = None
     _filename = None
     _abspath = False
@@ -1998,9 +2218,17 @@ class NXobject:
     _value = None
     _copyfile = None
     _copypath = None
+    _copyopts = None
     _memfile = None
     _uncopied_data = None
     _changed = True
+    _change_count = 0
+    _tree_cache = None
+    _signals_cache = None
+    _signal_cache = None
+    _names_cache = None
+    _dataset = None
+    _h5optpath = None
     _backup = None
     _file_modified = False
     _smoothing = None
@@ -2011,21 +2239,15 @@ class NXobject:
         self._group = kwargs.pop("group", None)
         self._copyfile = kwargs.pop("nxfile", None)
         self._copypath = kwargs.pop("nxpath", None)
-        self._attrs = kwargs
+        self._copyopts = kwargs
+        self._attrs = AttrDict(self)
 
     def __getstate__(self):
-        result = self.__dict__.copy()
-        hidden_keys = [key for key in result if key.startswith('_')]
-        needed_keys = ['_class', '_name', '_group', '_target',
-                       '_entries', '_attrs', '_filename', '_mode',
-                       '_dtype', '_shape', '_value', '_h5opts', '_changed']
-        for key in hidden_keys:
-            if key not in needed_keys:
-                del result[key]
-        return result
+        state = self.__dict__
+        return {key: state[key] for key in _pickle_keys if key in state}
 
-    def __setstate__(self, dict):
-        self.__dict__ = dict
+    def __setstate__(self, state):
+        self.__dict__.update(state)
 
     def __str__(self):
         return self.nxname
@@ -2048,26 +2270,24 @@ class NXobject:
             return self.nxname < other.nxname
 
     def _setattrs(self, attrs):
-        for k, v in attrs.items():
-            self._attrs[k] = v
+        self._attrs.update(attrs)
 
     def walk(self):
-        if False:
-            yield
+        return iter(())
 
     def _str_name(self, indent=0):
-        return " " * indent + self.nxname
+        return f"{' ' * indent}{self.nxname}"
 
     def _str_attrs(self, indent=0):
-        names = sorted(self.attrs)
         result = []
-        for k in names:
+        for k in self.attrs.sorted_keys():
+            value = self.attrs[k]
             txt1 = " " * indent
             txt2 = "@" + k + " = "
-            txt3 = text(self.attrs[k])
+            txt3 = text(value)
             if len(txt3) > 50:
                 txt3 = txt3[:46] + '...'
-            if is_text(self.attrs[k]):
+            if is_text(value):
                 txt3 = "'" + txt3 + "'"
             else:
                 txt3 = txt3
@@ -2306,6 +2526,9 @@ class NXobject:
     def set_changed(self):
         """Set an object's change status to changed."""
         self._changed = True
+        self._change_count += 1
+        self._tree_cache = self._signals_cache = self._names_cache = None
+        self._signal_cache = self._dataset = self._h5optpath = None
         if self.nxgroup:
             self.nxgroup.set_changed()
 
@@ -2370,22 +2593,25 @@ class NXobject:
     @property
     def nxpath(self):
         """Path to the object in the NeXus tree."""
-        group = self.nxgroup
         if self.nxclass == 'NXroot':
             return "/"
-        elif group is None:
-            return self.nxname
-        elif isinstance(group, NXroot):
-            return "/" + self.nxname
+        names = [self.nxname]
+        group = self._group
+        while group is not None and not group._clsflags & _CLS_ROOT:
+            names.append(group.nxname)
+            group = group._group
+        path = "/".join(reversed(names))
+        if group is None:
+            return path
         else:
-            return group.nxpath+"/"+self.nxname
+            return "/" + path
 
     @property
     def nxroot(self):
         """NXroot object of the NeXus tree."""
-        if self._group is None or isinstance(self, NXroot):
+        if self._group is None or self._clsflags & _CLS_ROOT:
             return self
-        elif isinstance(self._group, NXroot):
+        elif self._group._clsflags & _CLS_ROOT:
             return self._group
         else:
             return self._group.nxroot
@@ -2393,9 +2619,9 @@ class NXobject:
     @property
     def nxentry(self):
         """Parent NXentry group of the NeXus object."""
-        if self._group is None or isinstance(self, NXentry):
+        if self._group is None or self._clsflags & _CLS_ENTRY:
             return self
-        elif isinstance(self._group, NXentry):
+        elif self._group._clsflags & _CLS_ENTRY:
             return self._group
         else:
             return self._group.nxentry
@@ -2447,9 +2673,9 @@ class NXobject:
             return self.nxtarget
         elif self.nxgroup is None:
             return ""
-        elif isinstance(self.nxgroup, NXroot):
+        elif self.nxgroup._clsflags & _CLS_ROOT:
             return "/" + self.nxname
-        elif isinstance(self.nxgroup, NXlink):
+        elif self.nxgroup._clsflags & _CLS_LINK:
             group_path = self.nxgroup.nxtarget
         else:
             group_path = self.nxgroup.nxfilepath
@@ -2481,8 +2707,6 @@ class NXobject:
     @property
     def attrs(self):
         """Dictionary of object attributes."""
-        if self._attrs is None:
-            self._attrs = AttrDict()
         return self._attrs
 
     def is_plottable(self):
@@ -2499,7 +2723,7 @@ class NXobject:
     def is_linked(self):
         """True if the NeXus object is embedded in a link."""
         if self._group is not None:
-            if isinstance(self._group, NXlink):
+            if self._group._clsflags & _CLS_LINK:
                 return True
             else:
                 return self._group.is_linked()
@@ -2508,8 +2732,16 @@ class NXobject:
 
     def is_external(self):
         """True if the NeXus object is an external link."""
-        return (self.nxfilename is not None and
-                self.nxfilename != self.nxroot.nxfilename)
+        node, owner = self, None
+        while True:
+            if owner is None and node._filename is not None:
+                owner = node
+            if node._group is None or node._clsflags & _CLS_ROOT:
+                break
+            node = node._group
+        if owner is None or owner is node:
+            return False
+        return owner.nxfilename != node.nxfilename
 
     def file_exists(self):
         """True if the file containing the NeXus object exists."""
@@ -2738,9 +2970,9 @@ class NXfield(NXobject):
         3.16227766]))
 
     """
-    properties = ['mask', 'dtype', 'shape', 'chunks', 'compression',
-                  'compression_opts', 'fillvalue', 'fletcher32', 'maxshape',
-                  'scaleoffset', 'shuffle']
+    properties = frozenset(['mask', 'dtype', 'shape', 'chunks', 'compression',
+                            'compression_opts', 'fillvalue', 'fletcher32',
+                            'maxshape', 'scaleoffset', 'shuffle'])
 
     def __init__(self, value=None, name='unknown', shape=None, dtype=None,
                  group=None, attrs=None, **kwargs):
@@ -2748,26 +2980,28 @@ class NXfield(NXobject):
         self._name = name
         self._group = group
         self._value, self._dtype, self._shape = _getvalue(value, dtype, shape)
-        _size = _getsize(self._shape)
+        _large = _getsize(self._shape) > NX_CONFIG['maxsize']
         _h5opts = {}
-        _h5opts['chunks'] = kwargs.pop('chunks',
-                                       True if _size > NX_CONFIG['maxsize']
-                                       else None)
-        _h5opts['compression'] = kwargs.pop('compression',
-                                            NX_CONFIG['compression']
-                                            if _size > NX_CONFIG['maxsize']
-                                            else None)
-        _h5opts['compression_opts'] = kwargs.pop('compression_opts', None)
-        _h5opts['fillvalue'] = kwargs.pop('fillvalue', None)
-        _h5opts['fletcher32'] = kwargs.pop('fletcher32', None)
-        _h5opts['maxshape'] = _getmaxshape(kwargs.pop('maxshape', None),
-                                           self._shape)
-        _h5opts['scaleoffset'] = kwargs.pop('scaleoffset', None)
-        _h5opts['shuffle'] = kwargs.pop('shuffle',
-                                        True if _size > NX_CONFIG['maxsize']
-                                        else None)
-        self._h5opts = dict((k, v) for (k, v) in _h5opts.items()
-                            if v is not None)
+        _opt = kwargs.pop('chunks', True if _large else None)
+        if _opt is not None:
+            _h5opts['chunks'] = _opt
+        _opt = kwargs.pop('compression',
+                          NX_CONFIG['compression'] if _large else None)
+        if _opt is not None:
+            _h5opts['compression'] = _opt
+        for _key in ('compression_opts', 'fillvalue', 'fletcher32',
+                     'scaleoffset'):
+            _opt = kwargs.pop(_key, None)
+            if _opt is not None:
+                _h5opts[_key] = _opt
+        if 'maxshape' in kwargs:
+            _opt = _getmaxshape(kwargs.pop('maxshape'), self._shape)
+            if _opt is not None:
+                _h5opts['maxshape'] = _opt
+        _opt = kwargs.pop('shuffle', True if _large else None)
+        if _opt is not None:
+            _h5opts['shuffle'] = _opt
+        self._h5opts = _h5opts
         if attrs is None:
             attrs = {}
         attrs.update(kwargs)
@@ -2777,8 +3011,8 @@ class NXfield(NXobject):
         self.set_changed()
 
     def __dir__(self):
-        return sorted([c for c in dir(super()) if not c.startswith('_')]
-                      + list(self.attrs), key=natural_sort)
+        return sorted(_getclassdir(type(self)).union(self.attrs),
+                      key=natural_sort)
 
     def __repr__(self):
         if self._name != "unknown":
@@ -2798,8 +3032,9 @@ class NXfield(NXobject):
         """Return NumPy array attribute or NeXus attributes if not defined."""
         if name in _npattrs:
             return getattr(self.nxdata, name)
-        elif name in self.attrs:
-            return self.attrs[name]
+        attrs = self._attrs
+        if attrs is not None and name in attrs:
+            return attrs[name]
         else:
             raise AttributeError("'"+name+"' not in "+self.nxpath)
 
@@ -2818,8 +3053,7 @@ class NXfield(NXobject):
         If the attribute name starts with 'nx' or '_', they are assigned as
         NXfield attributes without further conversions.
         """
-        if (name.startswith('_') or name.startswith('nx') or
-                name in self.properties):
+        if name.startswith(('_', 'nx')) or name in self.properties:
             object.__setattr__(self, name, value)
         elif self.is_modifiable():
             self._attrs[name] = value
@@ -2860,7 +3094,11 @@ class NXfield(NXobject):
         NXfield
             Field containing the slice values.
         """
-        if is_real_slice(idx):
+        if idx is Ellipsis or (isinstance(idx, tuple) and not idx):
+            if self._value is not None and self.mask is None:
+                return NXfield(np.asarray(self._value[idx]), name=self.nxname,
+                               attrs=self.safe_attrs)
+        elif is_real_slice(idx):
             idx = convert_index(idx, self)
         if self._value is None:
             if self._uncopied_data:
@@ -2868,20 +3106,17 @@ class NXfield(NXobject):
             elif self.nxfilemode:
                 result = self._get_filedata(idx)
             elif self._memfile:
-                result = self._get_memdata(idx)
+                result = self._get_memdata(idx, mask=False)
                 mask = self.mask
                 if mask is not None:
                     if isinstance(mask, NXfield):
                         mask = mask[idx].nxdata
                     else:
                         mask = mask[idx]
-                    if isinstance(result, np.ma.MaskedArray):
-                        result = result.data
                     result = np.ma.array(result, mask=mask)
             elif self.fillvalue:
-                result = np.asarray(np.empty(self.shape,
-                                             dtype=self.dtype)[idx])
-                result.fill(self.fillvalue)
+                shape = np.broadcast_to(0, self.shape)[idx].shape
+                result = np.full(shape, self.fillvalue, dtype=self.dtype)
             else:
                 raise NeXusError(
                     "Data not available either in file or in memory")
@@ -2931,13 +3166,13 @@ class NXfield(NXobject):
                 if self.size > NX_CONFIG['maxsize']:
                     self._put_memdata(value, idx)
                 else:
-                    self._value = np.empty(self.shape, self.dtype)
                     if self.fillvalue:
-                        self._value.fill(self.fillvalue)
+                        fillvalue = self.fillvalue
                     elif is_string_dtype(self.dtype):
-                        self._value.fill(' ')
+                        fillvalue = ' '
                     else:
-                        self._value.fill(0)
+                        fillvalue = 0
+                    self._value = np.full(self.shape, fillvalue, self.dtype)
                     self._value[idx] = value
         self.set_changed()
 
@@ -2966,6 +3201,33 @@ class NXfield(NXobject):
         except Exception:
             return " " * indent + self.nxname
 
+    def _get_dataset(self, f):
+        """Return the h5py dataset storing the field in an open NeXus file.
+
+        The dataset is cached, and reused while the file remains open, so
+        that repeated reads do not have to resolve the path again.
+
+        Parameters
+        ----------
+        f : NXFile
+            Open NeXus file containing the field.
+
+        Returns
+        -------
+        h5py.Dataset
+            Dataset at the field's file path, or None if there is none.
+        """
+        path = self.nxfilepath
+        if self._dataset is not None:
+            dataset_path, dataset = self._dataset
+            if (dataset_path == path and dataset.id.valid and
+                    dataset.id.fileno == f.file.id.fileno):
+                return dataset
+        dataset = f.get(path)
+        if dataset is not None:
+            self._dataset = (path, dataset)
+        return dataset
+
     def _get_filedata(self, idx=()):
         """Return the specified slab from the NeXus file.
 
@@ -2980,13 +3242,25 @@ class NXfield(NXobject):
             Array containing the slice values.
         """
         with self.nxfile as f:
-            result = f.readvalue(self.nxfilepath, idx=idx)
+            dataset = self._get_dataset(f)
+            if dataset is None:
+                result = None
+            elif (isinstance(idx, tuple) and not idx and
+                  dataset.dtype.kind in 'biufc' and
+                  dataset.nbytes >= 1000000):
+                # Large arrays are read faster without h5py slicing
+                result = np.empty(dataset.shape, dtype=dataset.dtype)
+                dataset.read_direct(result)
+            else:
+                result = dataset[idx]
             if 'mask' in self.attrs:
                 try:
                     mask = self.nxgroup[self.attrs['mask']]
-                    result = np.ma.array(result,
-                                         mask=f.readvalue(mask.nxfilepath,
-                                                          idx=idx))
+                    dataset = mask._get_dataset(f)
+                    if dataset is not None:
+                        result = np.ma.array(result, mask=dataset[idx])
+                    else:
+                        result = np.ma.array(result, mask=None)
                 except KeyError:
                     pass
         return result
@@ -3001,6 +3275,7 @@ class NXfield(NXobject):
         idx : slice, optional
             Slice indices, by default ().
         """
+        self._h5optpath = None
         with self.nxfile as f:
             if isinstance(value, np.ma.MaskedArray):
                 if self.mask is None:
@@ -3010,13 +3285,16 @@ class NXfield(NXobject):
             else:
                 f.writevalue(self.nxpath, value, idx=idx)
 
-    def _get_memdata(self, idx=()):
+    def _get_memdata(self, idx=(), mask=True):
         """Retrieve data from HDF5 core memory file.
 
         Parameters
         ----------
         idx : slice, optional
             Slice indices, by default ().
+        mask : bool, optional
+            True if a mask stored in the memory file is to be applied to the
+            returned values, by default True.
 
         Returns
         -------
@@ -3024,7 +3302,7 @@ class NXfield(NXobject):
             Array containing the slice values.
         """
         result = self._memfile['data'][idx]
-        if 'mask' in self._memfile:
+        if mask and 'mask' in self._memfile:
             mask = self._memfile['mask'][idx]
             if mask.any():
                 result = np.ma.array(result, mask=mask)
@@ -3052,9 +3330,9 @@ class NXfield(NXobject):
 
     def _create_memfile(self):
         """Create an HDF5 core memory file to store the data."""
-        import tempfile
-        self._memfile = h5.File(tempfile.mkstemp(suffix='.nxs')[1], mode='r+',
-                                driver='core', backing_store=False).file
+        self._memfile = h5.File(f'nxmemory_{uuid.uuid4().hex}.nxs', mode='w',
+                                driver='core', backing_store=False,
+                                **_getcacheopts()).file
 
     def _create_memdata(self):
         """Create an HDF5 core memory dataset to store the data."""
@@ -3140,14 +3418,15 @@ class NXfield(NXobject):
                     self._create_memfile()
                     f.copy(_path, self._memfile, name='data')
                 self._uncopied_data = None
-                if (_getsize(self.shape) * np.dtype(self.dtype).itemsize
-                        <= NX_CONFIG['memory']*1000*1000):
+                if self.nbytes <= NX_CONFIG['memory']*1000*1000:
                     return f.readvalue(_path)
                 else:
                     return None
 
-    def __deepcopy__(self, memo={}):
+    def __deepcopy__(self, memo=None):
         """Return a deep copy of the field and its attributes."""
+        if memo is None:
+            memo = {}
         obj = self
         dpcpy = obj.__class__()
         memo[id(self)] = dpcpy
@@ -3163,10 +3442,8 @@ class NXfield(NXobject):
             dpcpy._memfile = dpcpy._uncopied_data = None
         elif obj.nxfilemode:
             dpcpy._uncopied_data = (obj.nxfile, obj.nxpath)
-        for k, v in obj.attrs.items():
-            dpcpy.attrs[k] = copy(v)
-        if 'target' in dpcpy.attrs:
-            del dpcpy.attrs['target']
+        dpcpy.attrs.update({k: v for k, v in obj.attrs.items()
+                            if k != 'target'})
         dpcpy._group = None
         return dpcpy
 
@@ -3255,41 +3532,42 @@ class NXfield(NXobject):
         if self.ndim != 1:
             raise NeXusError(
                 "NXfield must be one-dimensional to use the index function")
-        if self.nxdata[-1] < self.nxdata[0]:
-            flipped = True
-        else:
-            flipped = False
+        data = np.asarray(self.nxdata)
+        size = len(data)
+        flipped = data[-1] < data[0]
         if max:
             if flipped:
-                idx = np.max(len(self.nxdata) -
-                             len(self.nxdata[self.nxdata < value])-1, 0)
+                idx = (size - np.searchsorted(data[::-1], value, side='left')
+                       - 1)
             else:
-                idx = np.max(len(self.nxdata) -
-                             len(self.nxdata[self.nxdata > value])-1, 0)
+                idx = np.searchsorted(data, value, side='right') - 1
             try:
-                diff = value - self.nxdata[idx]
-                step = self.nxdata[idx+1] - self.nxdata[idx]
+                diff = value - data[idx]
+                step = data[idx+1] - data[idx]
                 if abs(diff/step) > 0.01:
                     idx = idx + 1
             except IndexError:
                 pass
         else:
             if flipped:
-                idx = len(self.nxdata[self.nxdata > value])
+                idx = size - np.searchsorted(data[::-1], value, side='right')
             else:
-                idx = len(self.nxdata[self.nxdata < value])
+                idx = np.searchsorted(data, value, side='left')
             try:
-                diff = value - self.nxdata[idx-1]
-                step = self.nxdata[idx] - self.nxdata[idx-1]
+                diff = value - data[idx-1]
+                step = data[idx] - data[idx-1]
                 if abs(diff/step) < 0.99:
                     idx = idx - 1
             except IndexError:
                 pass
-        return int(np.clip(idx, 0, len(self.nxdata)-1))
+        return int(np.clip(idx, 0, size-1))
 
     def __array__(self, *args, **kwargs):
         """Cast the NXfield as a NumPy array."""
-        return np.asarray(self.nxdata, *args, **kwargs)
+        if self._value is not None:
+            return np.asarray(self._value, *args, **kwargs)
+        else:
+            return np.asarray(self.nxdata, *args, **kwargs)
 
     def __array_wrap__(self, value, context=None, return_scalar=False):
         """Transform the array resulting from a ufunc to an NXfield."""
@@ -3320,28 +3598,30 @@ class NXfield(NXobject):
         if id(self) == id(other):
             return True
         elif isinstance(other, NXfield):
-            if (isinstance(self.nxvalue, np.ndarray) and
-                    isinstance(other.nxvalue, np.ndarray)):
+            value, other_value = self.nxvalue, other.nxvalue
+            if (isinstance(value, np.ndarray) and
+                    isinstance(other_value, np.ndarray)):
                 try:
-                    return np.array_equal(self, other)
+                    return np.array_equal(value, other_value)
                 except ValueError:
                     return False
             else:
-                return self.nxvalue == other.nxvalue
+                return value == other_value
         else:
             return self.nxvalue == other
 
     def __ne__(self, other):
         """Return true if the values of another NXfield are not the same."""
         if isinstance(other, NXfield):
-            if (isinstance(self.nxvalue, np.ndarray) and
-                    isinstance(other.nxvalue, np.ndarray)):
+            value, other_value = self.nxvalue, other.nxvalue
+            if (isinstance(value, np.ndarray) and
+                    isinstance(other_value, np.ndarray)):
                 try:
-                    return not np.array_equal(self, other)
+                    return not np.array_equal(value, other_value)
                 except ValueError:
                     return True
             else:
-                return self.nxvalue != other.nxvalue
+                return value != other_value
         else:
             return self.nxvalue != other
 
@@ -3447,12 +3727,12 @@ class NXfield(NXobject):
                        attrs=self.safe_attrs)
 
     def min(self, axis=None, **kwargs):
-        """Return the minimum value of the array ignoring NaNs."""
-        return np.nanmin(self.nxdata[self.nxdata > -np.inf], axis, **kwargs)
+        """Return the minimum value of the array ignoring NaNs and -inf."""
+        return _getextremum(np.nanmin, self.nxdata, -np.inf, axis, **kwargs)
 
     def max(self, axis=None, **kwargs):
-        """Return the maximum value of the array ignoring NaNs."""
-        return np.nanmax(self.nxdata[self.nxdata < np.inf], axis, **kwargs)
+        """Return the maximum value of the array ignoring NaNs and inf."""
+        return _getextremum(np.nanmax, self.nxdata, np.inf, axis, **kwargs)
 
     def sum(self, axis=None, **kwargs):
         """Return the sum of NXfield values.
@@ -3509,16 +3789,9 @@ class NXfield(NXobject):
         elif self.ndim > 1:
             raise NeXusError(
                 "Operation only possible on one-dimensional fields")
-        y = self / self.sum()
-        x = np.arange(self.shape[0])
-        if center:
-            c = center
-        else:
-            c = (y * x).sum()
-        if order == 1:
-            return c
-        else:
-            return (y * (x - c)**order).sum()
+        return NXfield(_getmoment(self.nxdata, np.arange(self.shape[0]),
+                                  order=order, center=center),
+                       name=self.nxname, attrs=self.safe_attrs)
 
     def mean(self):
         """Return the mean value of a one-dimensional field.
@@ -3584,8 +3857,11 @@ class NXfield(NXobject):
         This is used for one-dimensional fields containing axes that are
         stored as bin boundaries.
         """
-        return NXfield((self.nxdata[:-1]+self.nxdata[1:])/2,
-                       name=self.nxname, attrs=self.safe_attrs)
+        ax = self.nxdata
+        centers = np.empty(len(ax)-1, dtype=(ax[:1] / 2).dtype)
+        np.add(ax[:-1], ax[1:], out=centers)
+        centers *= 0.5
+        return NXfield(centers, name=self.nxname, attrs=self.safe_attrs)
 
     def boundaries(self):
         """Return a NXfield with bin boundaries.
@@ -3594,12 +3870,12 @@ class NXfield(NXobject):
         stored as bin centers.
         """
         ax = self.nxdata
-        start = ax[0] - (ax[1] - ax[0])/2
-        end = ax[-1] + (ax[-1] - ax[-2])/2
-        return NXfield(np.concatenate((np.atleast_1d(start),
-                                       (ax[:-1] + ax[1:])/2,
-                                       np.atleast_1d(end))),
-                       name=self.nxname, attrs=self.safe_attrs)
+        boundaries = np.empty(len(ax)+1, dtype=(ax[:1] / 2).dtype)
+        np.add(ax[:-1], ax[1:], out=boundaries[1:-1])
+        boundaries[1:-1] *= 0.5
+        boundaries[0] = ax[0] - (ax[1] - ax[0])/2
+        boundaries[-1] = ax[-1] + (ax[-1] - ax[-2])/2
+        return NXfield(boundaries, name=self.nxname, attrs=self.safe_attrs)
 
     def add(self, data, offset):
         """Add a slab into the data array.
@@ -3611,11 +3887,10 @@ class NXfield(NXobject):
         offset : tuple
             Offsets containing the lowest slab indices.
         """
-        idx = tuple(slice(i, i+j) for i, j in zip(offset, data.shape))
         if isinstance(data, NXfield):
-            self[idx] += data.nxdata.astype(self.dtype)
-        else:
-            self[idx] += data.astype(self.dtype)
+            data = data.nxdata
+        idx = tuple(slice(i, i+j) for i, j in zip(offset, data.shape))
+        self[idx] = self[idx].nxdata + data.astype(self.dtype, copy=False)
 
     def walk(self):
         yield self
@@ -3665,26 +3940,25 @@ class NXfield(NXobject):
 
         def plot_axis(axis):
             return NXfield(axis.nxvalue, name=axis.nxname, attrs=axis.attrs)
-        if self.nxgroup:
-            if 'axes' in self.attrs:
-                axis_names = _readaxes(self.attrs['axes'])
-            elif 'axes' in self.nxgroup.attrs:
-                axis_names = _readaxes(self.nxgroup.attrs['axes'])
+        group, plot_rank = self.nxgroup, self.plot_rank
+        if group:
+            axis_names = self.attrs.get('axes')
+            if axis_names is None:
+                axis_names = group.attrs.get('axes')
+            if axis_names is not None:
+                axis_names = _readaxes(axis_names)[:plot_rank]
             else:
-                axis_names = ['.'] * self.plot_rank
-            if len(axis_names) > self.plot_rank:
-                axis_names = axis_names[:self.plot_rank]
+                axis_names = ['.'] * plot_rank
             axes = []
             for i, axis_name in enumerate(axis_names):
-                axis_name = axis_name.strip()
-                if (axis_name not in self.nxgroup or
-                        invalid_axis(self.nxgroup[axis_name])):
+                axis = group.entries.get(axis_name.strip())
+                if axis is None or invalid_axis(axis):
                     axes.append(empty_axis(i))
                 else:
-                    axes.append(plot_axis(self.nxgroup[axis_name]))
+                    axes.append(plot_axis(axis))
             return axes
         else:
-            return [empty_axis(i) for i in range(self.plot_rank)]
+            return [empty_axis(i) for i in range(plot_rank)]
 
     def valid_axes(self, axes):
         """Return True if the axes are consistent with the field.
@@ -3706,14 +3980,18 @@ class NXfield(NXobject):
         """
         if not is_iterable(axes):
             axes = [axes]
-        plot_axes = [axis for axis in axes if axis.size >= 1]
-        axis_shape = [axis.size for axis in plot_axes]
-        if (all(axis.ndim == 1 for axis in plot_axes) and
-            len([x for x, y in zip(self.plot_shape, axis_shape)
-                 if x == y or x == y-1]) == self.plot_rank):
-            return True
-        else:
-            return False
+        plot_shape = self.plot_shape
+        i = 0
+        for axis in axes:
+            size = axis.size
+            if size < 1:
+                continue
+            elif axis.ndim != 1:
+                return False
+            elif i < len(plot_shape) and plot_shape[i] not in (size, size-1):
+                return False
+            i += 1
+        return i >= len(plot_shape)
 
     @property
     def nxvalue(self):
@@ -3731,16 +4009,15 @@ class NXfield(NXobject):
         _value = self.nxdata
         if _value is None:
             return None
-        elif (self.dtype is not None and
-              (self.dtype.type == np.bytes_ or self.dtype.type == np.str_ or
-               self.dtype == string_dtype)):
-            if self.shape == ():
+        dtype, shape = self._dtype, self.shape
+        if dtype is not None and is_string_dtype(dtype):
+            if shape == ():
                 return text(_value)
-            elif self.shape == (1,):
+            elif shape == (1,):
                 return text(_value[0])
             else:
                 return [text(value) for value in _value[()]]
-        elif self.shape == (1,):
+        elif shape == (1,):
             return _value.item()
         else:
             return _value
@@ -3755,8 +4032,7 @@ class NXfield(NXobject):
         if self._value is None:
             if self.dtype is None or self.shape is None:
                 return None
-            if (_getsize(self.shape) * np.dtype(self.dtype).itemsize
-                    <= NX_CONFIG['memory']*1000*1000):
+            if self.nbytes <= NX_CONFIG['memory']*1000*1000:
                 try:
                     if self.nxfilemode:
                         self._value = self._get_filedata()
@@ -3767,14 +4043,16 @@ class NXfield(NXobject):
                 except Exception:
                     raise NeXusError(f"Cannot read data for '{self.nxname}'")
                 if self._value is not None:
-                    self._value.shape = self.shape
+                    self._value = self._value.reshape(self.shape)
             else:
                 raise NeXusError("Use slabs to access data larger than "
                                  f"NX_MEMORY={NX_CONFIG['memory']} MB")
-        if self.mask is not None:
+        # Only a mask stored as a field in the parent group is applied here
+        if 'mask' in self._attrs:
             try:
-                if isinstance(self.mask, NXfield):
-                    mask = self.mask.nxdata
+                mask = self.mask
+                if isinstance(mask, NXfield):
+                    mask = mask.nxdata
                     if isinstance(self._value, np.ma.MaskedArray):
                         self._value.mask = mask
                     else:
@@ -3792,6 +4070,7 @@ class NXfield(NXobject):
                 value, self._dtype, self._shape)
             if self._memfile:
                 self._put_memdata(self._value)
+            self.set_changed()
 
     @property
     def nxtitle(self):
@@ -3800,15 +4079,15 @@ class NXfield(NXobject):
         If there is no title attribute in the parent group, the group's path is
         returned.
         """
-        root = self.nxroot
-        if root.nxname != '' and root.nxname != 'root':
-            return (root.nxname + '/' + self.nxpath.lstrip('/')).rstrip('/')
+        root_name, path = self.nxroot.nxname, self.nxpath
+        if root_name != '' and root_name != 'root':
+            return (root_name + '/' + path.lstrip('/')).rstrip('/')
         else:
             fname = self.nxfilename
             if fname is not None:
-                return str(Path(fname).name) + ':' + self.nxpath
+                return str(Path(fname).name) + ':' + path
             else:
-                return self.nxpath
+                return path
 
     @property
     def mask(self):
@@ -3817,9 +4096,12 @@ class NXfield(NXobject):
         Only works if the NXfield is in a group and has the 'mask' attribute
         set or if the NXfield array is defined as a masked array.
         """
-        if 'mask' in self.attrs:
-            if self.nxgroup and self.attrs['mask'] in self.nxgroup:
-                return self.nxgroup[self.attrs['mask']]
+        mask_name = self.attrs.get('mask')
+        if mask_name is not None and self.nxgroup:
+            try:
+                return self.nxgroup[mask_name]
+            except Exception:
+                pass
         if self._value is None and self._memfile:
             if 'mask' in self._memfile:
                 return self._memfile['mask']
@@ -3834,9 +4116,9 @@ class NXfield(NXobject):
             raise NeXusError("NeXus file opened as readonly")
         elif self.is_linked():
             raise NeXusError("Cannot modify an item in a linked group")
-        if 'mask' in self.attrs:
+        mask_name = self.attrs.get('mask')
+        if mask_name is not None:
             if self.nxgroup:
-                mask_name = self.attrs['mask']
                 if mask_name in self.nxgroup:
                     self.nxgroup[mask_name][()] = value
             else:
@@ -3851,6 +4133,7 @@ class NXfield(NXobject):
                 self._value.mask = value
             else:
                 self._value = np.ma.array(self._value, mask=value)
+        self.set_changed()
 
     def resize(self, shape, axis=None):
         """Resize the NXfield.
@@ -3872,7 +4155,10 @@ class NXfield(NXobject):
                     "Argument must be a single integer if axis is specified")
             shape = list(self._shape)
             shape[axis] = newlen
-        if self.checkshape(shape):
+        shape = _getshape(shape)
+        if shape == self._shape:
+            return
+        elif self.checkshape(shape):
             if self.nxfilemode:
                 with self.nxfile as f:
                     f[self.nxpath].shape = shape
@@ -3884,7 +4170,11 @@ class NXfield(NXobject):
             raise NeXusError("Shape incompatible with current NXfield")
         self._shape = shape
         if self._value is not None:
-            self._value.resize(self._shape, refcheck=False)
+            if self._value.size == _getsize(shape):
+                self._value = self._value.reshape(shape)
+            else:
+                self._value.resize(shape, refcheck=False)
+        self.set_changed()
 
     def checkshape(self, shape):
         """Return True if the shape argument is compatible with the NXfield."""
@@ -3932,8 +4222,23 @@ class NXfield(NXobject):
         ----------
         name : str
             Name of the h5py option.
-        """
-        if self.nxfilemode:
+
+        Notes
+        -----
+        The dataset creation options of a field stored in a file are all
+        read together the first time one of them is requested, and reused
+        until the field is changed, written or resized, or its file name or
+        path changes.
+        """
+        if self.nxfilemode and name in _h5optnames:
+            path = (self.nxfilename, self.nxfilepath)
+            if path != self._h5optpath:
+                with self.nxfile as f:
+                    dataset = f[self.nxfilepath]
+                    for option in _h5optnames:
+                        self._h5opts[option] = getattr(dataset, option)
+                self._h5optpath = path
+        elif self.nxfilemode:
             with self.nxfile as f:
                 self._h5opts[name] = getattr(f[self.nxfilepath], name)
         elif self._memfile:
@@ -4040,10 +4345,10 @@ class NXfield(NXobject):
     @property
     def ndim(self):
         """Rank of the NXfield."""
-        try:
-            return len(self.shape)
-        except TypeError:
+        if self._shape is None:
             return 0
+        else:
+            return len(self._shape)
 
     @property
     def size(self):
@@ -4058,7 +4363,6 @@ class NXfield(NXobject):
     @property
     def human_size(self):
         """Human readable string of the number of bytes in the NXfield."""
-        import math
         unit = ['B', 'kB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB']
         size = self.nbytes
         magnitude = int(math.floor(math.log(size, 1000)))
@@ -4068,16 +4372,19 @@ class NXfield(NXobject):
     @property
     def safe_attrs(self):
         """Attributes that can be safely copied to derived NXfields."""
-        return {key: self.attrs[key] for key in self.attrs
-                if (key != 'target' and key != 'signal' and key != 'axes')}
+        attrs = self.attrs
+        return {key: attrs[key] for key in attrs if key not in _unsafe_attrs}
 
     @property
     def reversed(self):
         """True if the one-dimensional field has decreasing values."""
-        if self.ndim == 1 and self.nxdata[-1] < self.nxdata[0]:
-            return True
-        else:
+        if self.ndim != 1:
             return False
+        elif self._value is None:
+            # Only read the end points of data stored in a file
+            return bool(self[-1].nxdata < self[0].nxdata)
+        else:
+            return bool(self._value[-1] < self._value[0])
 
     @property
     def plot_shape(self):
@@ -4086,11 +4393,10 @@ class NXfield(NXobject):
         Size-1 axes are removed from the shape for multidimensional data.
         """
         try:
-            _shape = list(self.shape)
+            _shape = tuple(self.shape)
             if len(_shape) > 1:
-                while 1 in _shape:
-                    _shape.remove(1)
-            return tuple(_shape)
+                return tuple(i for i in _shape if i != 1)
+            return _shape
         except Exception:
             return ()
 
@@ -4109,14 +4415,12 @@ class NXfield(NXobject):
 
     def is_plottable(self):
         """True if the NXfield is plottable."""
-        if self.plot_rank > 0:
-            return True
-        else:
-            return False
+        return self.plot_rank > 0
 
     def is_image(self):
         """True if the field is compatible with an RGB(A) image."""
-        return self.ndim == 3 and (self.shape[2] == 3 or self.shape[2] == 4)
+        shape = self.shape
+        return len(shape) == 3 and shape[2] in (3, 4)
 
     def plot(self, fmt='', xmin=None, xmax=None, ymin=None, ymax=None,
              vmin=None, vmax=None, **kwargs):
@@ -4160,14 +4464,8 @@ class NXfield(NXobject):
             raise NeXusError(
                     f"'{Path(self.nxfilename).resolve()}' does not exist")
 
-        try:
-            from __main__ import plotview
-            if plotview is None:
-                raise ImportError
-        except ImportError:
-            from .plot import plotview
-
         if self.is_plottable():
+            plotview = _getplotview()
             data = NXdata(self, self.nxaxes, title=self.nxtitle)
             if ('interpretation' in self.attrs and
                     'rgb' in self.attrs['interpretation'] and self.is_image()):
@@ -4270,8 +4568,10 @@ class NXvirtualfield(NXfield):
         self._create_memfile()
         self._memfile.create_virtual_dataset('data', layout)
 
-    def __deepcopy__(self, memo={}):
+    def __deepcopy__(self, memo=None):
         """Return a deep copy of the virtual field and its attributes."""
+        if memo is None:
+            memo = {}
         obj = self
         dpcpy = obj.__class__(self._vpath, self._vfiles)
         memo[id(self)] = dpcpy
@@ -4285,10 +4585,8 @@ class NXvirtualfield(NXfield):
         dpcpy._h5opts = copy(obj._h5opts)
         dpcpy._changed = True
         dpcpy._uncopied_data = None
-        for k, v in obj.attrs.items():
-            dpcpy.attrs[k] = copy(v)
-        if 'target' in dpcpy.attrs:
-            del dpcpy.attrs['target']
+        dpcpy.attrs.update({k: v for k, v in obj.attrs.items()
+                            if k != 'target'})
         dpcpy._group = None
         return dpcpy
 
@@ -4475,8 +4773,8 @@ class NXgroup(NXobject):
         self.set_changed()
 
     def __dir__(self):
-        return sorted([c for c in dir(super()) if not c.startswith('_')]
-                      + list(self)+list(self.attrs), key=natural_sort)
+        return sorted(_getclassdir(type(self)).union(self, self.attrs),
+                      key=natural_sort)
 
     def __repr__(self):
         return f"{self.__class__.__name__}('{self.nxname}')"
@@ -4539,20 +4837,17 @@ class NXgroup(NXobject):
 
     def __getitem__(self, key):
         """Return a NeXus field or group in the current group."""
-        try:
-            path = PurePath(str(key))
-        except TypeError:
-            raise NeXusError("Invalid index")
-        if path.is_absolute():
+        path = str(key)
+        if path.startswith('/'):
             node = self.nxroot
-            path = path.relative_to('/')
         else:
             node = self
-        for name in path.parts:
-            try:
-                node = node.entries[name]
-            except KeyError:
-                raise NeXusError("Invalid path")
+        for name in path.split('/'):
+            if name and name != '.':
+                try:
+                    node = node.entries[name]
+                except KeyError:
+                    raise NeXusError("Invalid path")
         return node
 
     def __setitem__(self, key, value):
@@ -4591,20 +4886,21 @@ class NXgroup(NXobject):
             raise NeXusError("Cannot modify an item in a linked group")
         elif isinstance(value, NXroot):
             raise NeXusError("Cannot assign an NXroot group to another group")
-        elif key in group and group.nxfilemode:
+        elif group.nxfilemode and key in group:
+            entry = group.entries[key]
             if isinstance(value, NXgroup):
                 raise NeXusError(
                     "Cannot assign an NXgroup to an existing group entry")
             elif isinstance(value, NXlink):
                 raise NeXusError(
                     "Cannot assign an NXlink to an existing group entry")
-            elif isinstance(group.entries[key], NXlink):
+            elif isinstance(entry, NXlink):
                 raise NeXusError("Cannot assign values to an NXlink")
-            elif group.entries[key].is_linked():
+            elif entry.is_linked():
                 raise NeXusError("Cannot modify an item in linked group")
-            group.entries[key].nxdata = value
+            entry.nxdata = value
             if isinstance(value, NXfield):
-                group.entries[key]._setattrs(value.attrs)
+                entry._setattrs(value.attrs)
         elif isinstance(value, NXobject):
             if group.nxfilemode is None and value._copyfile is not None:
                 raise NeXusError(
@@ -4618,8 +4914,9 @@ class NXgroup(NXobject):
             group.entries[key] = value
         else:
             group.entries[key] = NXfield(value=value, name=key, group=group)
-        if isinstance(group.entries[key], NXfield):
-            field = group.entries[key]
+        entry = group.entries[key]
+        if isinstance(entry, NXfield):
+            field = entry
             if field._value is not None:
                 if isinstance(field._value, np.ma.MaskedArray):
                     mask_name = field._create_mask()
@@ -4631,10 +4928,9 @@ class NXgroup(NXobject):
                     field._memfile.copy('mask', group[mask_name]._memfile,
                                         'data')
                     del field._memfile['mask']
-        elif (isinstance(group.entries[key], NXentry) and
-              not isinstance(group, NXroot)):
-            group.entries[key].nxclass = NXsubentry
-        group.entries[key].update()
+        elif isinstance(entry, NXentry) and not isinstance(group, NXroot):
+            entry.nxclass = NXsubentry
+        entry.update()
 
     def __delitem__(self, key):
         """Delete an entry in the group dictionary.
@@ -4647,6 +4943,13 @@ class NXgroup(NXobject):
         Notes
         -----
         If a mask is associated with a deleted field, it is also deleted.
+        Both are removed from the file within a single file context. When
+        deleting several entries from a saved group, the file can be kept
+        open for all of them with, e.g.,
+
+        >>> with root.nxfile:
+        ...     for name in names:
+        ...         del root['entry'][name]
         """
         if self.nxfilemode == 'r':
             raise NeXusError("NeXus file opened as readonly")
@@ -4662,15 +4965,20 @@ class NXgroup(NXobject):
                         raise NeXusError("Invalid path")
             if key not in group:
                 raise NeXusError("'"+key+"' not in "+group.nxpath)
-            elif group[key].is_linked():
+            entry = group.entries[key]
+            if entry.is_linked():
                 raise NeXusError("Cannot delete an item in a linked group")
+            if 'mask' in entry.attrs:
+                mask = entry.mask
+            else:
+                mask = None
             if group.nxfilemode == 'rw':
                 with group.nxfile as f:
-                    if 'mask' in group.entries[key].attrs:
-                        del f[group.entries[key].mask.nxpath]
-                    del f[group.entries[key].nxpath]
-            if 'mask' in group.entries[key].attrs:
-                del group.entries[group.entries[key].mask.nxname]
+                    if mask is not None:
+                        del f[mask.nxpath]
+                    del f[entry.nxpath]
+            if mask is not None:
+                del group.entries[mask.nxname]
             del group.entries[key]
             group.set_changed()
 
@@ -4679,7 +4987,8 @@ class NXgroup(NXobject):
         if isinstance(self, NXroot) and str(key) == '/':
             return True
         elif isinstance(key, NXobject):
-            return id(key) in [id(x) for x in self.entries.values()]
+            return (key.nxgroup is self and
+                    self.entries.get(key.nxname) is key)
         else:
             try:
                 return isinstance(self[key], NXobject)
@@ -4692,8 +5001,11 @@ class NXgroup(NXobject):
             return False
         elif id(self) == id(other):
             return True
+        entries, other_entries = self.entries, other.entries
+        if entries.keys() != other_entries.keys():
+            return False
         else:
-            return self.entries == other.entries
+            return entries == other_entries
 
     def __iter__(self):
         """Implement key iteration."""
@@ -4705,29 +5017,46 @@ class NXgroup(NXobject):
 
     def __deepcopy__(self, memo):
         """Return a deep copy of the group."""
+        return self._deepcopy(memo)
+
+    def _deepcopy(self, memo, exclude=()):
+        """Return a deep copy of the group without the excluded entries.
+
+        Parameters
+        ----------
+        memo : dict
+            Dictionary of objects already copied, as used by `deepcopy`.
+        exclude : tuple of str, optional
+            Names of entries that are not copied, by default ().
+        """
         obj = self
         dpcpy = obj.__class__()
         dpcpy._name = self._name
         memo[id(self)] = dpcpy
         dpcpy._changed = True
+        entries = dpcpy.entries
         for k, v in obj.items():
-            if isinstance(v, NXlink):
+            if k in exclude:
+                continue
+            elif isinstance(v, NXlink):
                 v = v.nxlink
-            dpcpy.entries[k] = deepcopy(v, memo)
-            dpcpy.entries[k]._group = dpcpy
-        for k, v in obj.attrs.items():
-            dpcpy.attrs[k] = copy(v)
-        if 'target' in dpcpy.attrs:
-            del dpcpy.attrs['target']
+            entries[k] = child = deepcopy(v, memo)
+            child._group = dpcpy
+        dpcpy.attrs.update({k: v for k, v in obj.attrs.items()
+                            if k != 'target'})
         dpcpy._group = None
         return dpcpy
 
     def walk(self):
         """Walk through all the values in the group."""
-        yield self
-        for node in self.values():
-            for child in node.walk():
-                yield child
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, NXgroup):
+                yield node
+                stack.extend(reversed(list(node.values())))
+            else:
+                yield from node.walk()
 
     def update(self):
         """Update the NXgroup, including its children, in the NeXus file."""
@@ -4761,8 +5090,7 @@ class NXgroup(NXobject):
 
     def itervalues(self):
         """Return an iterator over group objects."""
-        for key in self.entries:
-            yield self.entries.get(key)
+        return iter(self.entries.values())
 
     def items(self):
         """Return a list of the NeXus objects as (key,value) pairs."""
@@ -4770,8 +5098,7 @@ class NXgroup(NXobject):
 
     def iteritems(self):
         """Return an iterator over (name, object) pairs."""
-        for key in self.entries:
-            yield (key, self.entries.get(key))
+        return iter(self.entries.items())
 
     def has_key(self, name):
         """Return true if an object of the specified name is in the group."""
@@ -4805,8 +5132,33 @@ class NXgroup(NXobject):
         list of NXfields or NXgroups
             List of fields or groups of the same class.
         """
-        return [self.entries[i] for i in sorted(self.entries, key=natural_sort)
-                if self.entries[i].nxclass == nxclass]
+        entries = self.entries
+        return [entries[name] for name in self._sorted_names()
+                if entries[name].nxclass == nxclass]
+
+    def _first_component(self, *nxclasses):
+        """Return the first entry in the group of the given classes.
+
+        The classes are searched in the order given. Within each class,
+        entries are in the same order as the list returned by `component`.
+
+        Parameters
+        ----------
+        *nxclasses : str
+            Class names
+
+        Returns
+        -------
+        NXfield or NXgroup
+            First matching field or group, or None if there is no match.
+        """
+        entries = self.entries
+        names = self._sorted_names()
+        for nxclass in nxclasses:
+            for name in names:
+                if entries[name].nxclass == nxclass:
+                    return entries[name]
+        return None
 
     def move(self, item, group, name=None):
         """Move an item in the group to another group within the same tree.
@@ -4946,13 +5298,14 @@ class NXgroup(NXobject):
             axes = self.nxaxes
             averages = []
             for ax in axis:
-                summedaxis = deepcopy(axes[ax])
-                summedaxis.attrs["minimum"] = summedaxis.nxdata[0]
-                summedaxis.attrs["maximum"] = summedaxis.nxdata[-1]
-                summedaxis.attrs["summed_bins"] = summedaxis.size
-                averages.append(NXfield(
-                    0.5*(summedaxis.nxdata[0]+summedaxis.nxdata[-1]),
-                    name=summedaxis.nxname, attrs=summedaxis.attrs))
+                summedaxis = axes[ax]
+                first, last = summedaxis.nxdata[0], summedaxis.nxdata[-1]
+                attrs = {k: v for k, v in summedaxis.attrs.items()
+                         if k != 'target'}
+                attrs.update(minimum=first, maximum=last,
+                             summed_bins=summedaxis.size)
+                averages.append(NXfield(0.5*(first+last),
+                                        name=summedaxis.nxname, attrs=attrs))
             axes = [axes[i] for i in range(len(axes)) if i not in axis]
             result = NXdata(signal, axes)
             summed_bins = 1
@@ -4965,7 +5318,11 @@ class NXgroup(NXobject):
             else:
                 result.attrs["summed_bins"] = summed_bins
             if self.nxerrors:
-                errors = np.sqrt((self.nxerrors.nxdata**2).sum(axis))
+                # Sum the squared errors without a full-size temporary
+                errors = np.ma.filled(self.nxerrors.nxdata, 0)
+                dims = list(range(errors.ndim))
+                kept = [i for i in dims if i not in axis]
+                errors = np.sqrt(np.einsum(errors, dims, errors, dims, kept))
                 if averaged:
                     result.nxerrors = NXfield(errors) / summed_bins
                 else:
@@ -5029,16 +5386,10 @@ class NXgroup(NXobject):
         if not hasattr(self, "nxclass"):
             raise NeXusError(
                 "Operation not allowed for groups of unknown class")
-        y = signal / signal.sum()
-        x = centers(axes[0], y.shape[0])
-        if center:
-            c = center
-        else:
-            c = (y * x).sum()
-        if order == 1:
-            return c
-        else:
-            return (y * (x - c)**order).sum()
+        x = centers(axes[0], signal.shape[0])
+        return NXfield(_getmoment(signal.nxdata, x, order=order,
+                                  center=center),
+                       name=signal.nxname, attrs=signal.safe_attrs)
 
     def mean(self):
         """Return the mean value of one-dimensional data.
@@ -5095,12 +5446,7 @@ class NXgroup(NXobject):
 
     def is_plottable(self):
         """Return True if the group contains plottable data."""
-        plottable = False
-        for entry in self:
-            if self[entry].is_plottable():
-                plottable = True
-                break
-        return plottable
+        return any(entry.is_plottable() for entry in self.entries.values())
 
     @property
     def plottable_data(self):
@@ -5145,35 +5491,80 @@ class NXgroup(NXobject):
     def signals(self):
         """Return a dictionary of NXfield's containing signal data.
 
-        The key is the value of the signal attribute.
+        The key is the value of the signal attribute. The result is cached
+        until the group is changed, unless the group contains links, whose
+        targets may be modified elsewhere in the tree.
         """
+        if self._signals_cache is not None:
+            return dict(self._signals_cache)
         signals = {}
+        cacheable = not isinstance(self, NXlink)
         for obj in self.values():
-            if 'signal' in obj.attrs:
-                signals[obj.attrs['signal']] = obj
-        return signals
+            if isinstance(obj, NXlink):
+                cacheable = False
+            signal = obj.attrs.get('signal')
+            if signal is not None:
+                signals[signal] = obj
+        if cacheable:
+            self._signals_cache = signals
+        return dict(signals)
+
+    def _sorted_names(self):
+        """Return the names of the group entries sorted in natural order.
+
+        The list is cached until the group is changed. Link groups are not
+        cached, since their entries are rebuilt from the target.
+        """
+        entries = self.entries
+        names = self._names_cache
+        if names is None or len(names) != len(entries):
+            names = sorted(entries, key=_natural_key)
+            if not isinstance(self, NXlink):
+                self._names_cache = names
+        return names
 
     def _str_name(self, indent=0):
-        return " " * indent + self.nxname + ':' + self.nxclass
+        return f"{' ' * indent}{self.nxname}:{self.nxclass}"
 
     def _str_tree(self, indent=0, attrs=False, recursive=False):
+        """Return the group tree as a string.
+
+        The string is cached and reused while the group is marked as
+        unchanged. Trees containing links are not cached, since their
+        targets may be modified elsewhere in the tree.
+        """
+        key = (indent, attrs, recursive)
+        if (not self._changed and self._tree_cache is not None and
+                self._tree_cache[0] == key):
+            return self._tree_cache[1]
+        cacheable = not isinstance(self, NXlink)
         result = [self._str_name(indent=indent)]
         if self.attrs and (attrs or indent == 0):
             result.append(self._str_attrs(indent=indent+2))
         entries = self.entries
         if entries:
-            names = sorted(entries, key=natural_sort)
+            names = self._sorted_names()
             if recursive:
                 if recursive is True or recursive >= indent:
                     for k in names:
-                        result.append(entries[k]._str_tree(indent=indent+2,
-                                                           attrs=attrs,
-                                                           recursive=recursive)
-                                      )
+                        entry = entries[k]
+                        result.append(entry._str_tree(indent=indent+2,
+                                                      attrs=attrs,
+                                                      recursive=recursive))
+                        if isinstance(entry, NXlink):
+                            cacheable = False
+                        elif (isinstance(entry, NXgroup) and
+                              entry._tree_cache is None):
+                            cacheable = False
             else:
                 for k in names:
                     result.append(entries[k]._str_name(indent=indent+2))
-        return "\n".join(result)
+        result = "\n".join(result)
+        if cacheable:
+            self._tree_cache = (key, result)
+        else:
+            self._tree_cache = None
+        return result
 
     @property
     def nxtitle(self):
@@ -5187,16 +5578,15 @@ class NXgroup(NXobject):
         elif self.nxgroup and 'title' in self.nxgroup:
             return text(self.nxgroup.title)
         else:
-            root = self.nxroot
-            if root.nxname != '' and root.nxname != 'root':
-                return (root.nxname + '/' +
-                        self.nxpath.lstrip('/')).rstrip('/')
+            root_name, path = self.nxroot.nxname, self.nxpath
+            if root_name != '' and root_name != 'root':
+                return (root_name + '/' + path.lstrip('/')).rstrip('/')
             else:
                 fname = self.nxfilename
                 if fname is not None:
-                    return str(Path(fname).name) + ':' + self.nxpath
+                    return str(Path(fname).name) + ':' + path
                 else:
-                    return self.nxpath
+                    return path
 
     @property
     def entries(self):
@@ -5246,6 +5636,7 @@ class NXlink(NXobject):
     """
 
     _class = 'NXlink'
+    _clsflags = _CLS_LINK
 
     def __init__(self, target=None, file=None, name=None, group=None,
                  abspath=False, soft=False):
@@ -5286,10 +5677,14 @@ class NXlink(NXobject):
         """Return the requested attribute from the target object.
 
         The value of the corresponding target attribute is returned, reading
-        from the external file if necessary.
+        from the external file if necessary. Once resolved, the target is
+        read directly from the instance dictionary.
         """
         try:
-            return getattr(self.nxlink, name)
+            link = self.__dict__.get('_link')
+            if link is None:
+                link = self.nxlink
+            return getattr(link, name)
         except Exception:
             raise AttributeError(
                 f"Cannot resolve the link to '{self._target}'")
@@ -5341,29 +5736,30 @@ class NXlink(NXobject):
         else:
             return False
 
-    def __deepcopy__(self, memo={}):
+    def __deepcopy__(self, memo=None):
         """Return a deep copy of the link containing the target information."""
+        if memo is None:
+            memo = {}
         obj = self
         dpcpy = obj.__class__()
         memo[id(self)] = dpcpy
-        dpcpy._name = copy(self.nxname)
-        dpcpy._target = copy(obj._target)
+        dpcpy._name = self.nxname
+        dpcpy._target = obj._target
         if obj._filename:
-            dpcpy._filename = copy(obj.nxfilename)
+            dpcpy._filename = obj.nxfilename
         else:
             dpcpy._filename = None
-        dpcpy._abspath = copy(obj._abspath)
+        dpcpy._abspath = obj._abspath
         dpcpy._link = None
         dpcpy._group = None
         return dpcpy
 
     def _str_name(self, indent=0):
         if self._filename:
-            return (" " * indent + self.nxname + ' -> ' +
-                    text(self._filename) + "['" + text(self._target) +
-                    "']")
+            return (f"{' ' * indent}{self.nxname} -> "
+                    f"{text(self._filename)}['{text(self._target)}']")
         else:
-            return " " * indent + self.nxname + ' -> ' + text(self._target)
+            return f"{' ' * indent}{self.nxname} -> {text(self._target)}"
 
     def _str_tree(self, indent=0, attrs=False, recursive=False):
         return self._str_name(indent=indent)
@@ -5386,8 +5782,8 @@ class NXlink(NXobject):
         class (NXlinkfield or NXlinkgroup) and attributes if the target
         is accessible.
         """
-        self.initialize_link()
         if self._link is None:
+            self.initialize_link()
             if self.is_external():
                 self._link = self.external_link
             else:
@@ -5517,6 +5913,8 @@ class NXlinkfield(NXlink, NXfield):
 class NXlinkgroup(NXlink, NXgroup):
     """Class for NeXus linked groups."""
 
+    _entries_key = None
+
     def __init__(self, target=None, file=None, name=None, abspath=False,
                  soft=False, **kwargs):
         NXlink.__init__(self, target=target, file=file, name=name,
@@ -5536,19 +5934,20 @@ class NXlinkgroup(NXlink, NXgroup):
 
     def _str_name(self, indent=0):
         if self._filename:
-            return (" " * indent + self.nxname + ':' + self.nxclass +
-                    ' -> ' + text(self._filename) +
-                    "['" + text(self._target) + "']")
+            return (f"{' ' * indent}{self.nxname}:{self.nxclass} -> "
+                    f"{text(self._filename)}['{text(self._target)}']")
         else:
-            return (" " * indent + self.nxname + ':' + self.nxclass +
-                    ' -> ' + text(self._target))
+            return (f"{' ' * indent}{self.nxname}:{self.nxclass} -> "
+                    f"{text(self._target)}")
 
     def _str_tree(self, indent=0, attrs=False, recursive=False):
+        if self.is_external() and not self.file_exists():
+            return NXlink._str_tree(self, indent=indent)
         try:
             return NXgroup._str_tree(self, indent=indent, attrs=attrs,
                                      recursive=recursive)
-        except Exception:
-            return NXlink(self)._str_tree(self, indent=indent)
+        except (NeXusError, OSError, KeyError, AttributeError):
+            return NXlink._str_tree(self, indent=indent)
 
     @property
     def entries(self):
@@ -5558,8 +5957,17 @@ class NXlinkgroup(NXlink, NXgroup):
         -------
         dict of NXfields and/or NXgroups
             Dictionary of group objects.
-        """
-        _linked_entries = self.nxlink.entries
+
+        Notes
+        -----
+        Copies of the target entries are reused until the target group, or
+        any object within it, is changed.
+        """
+        _link = self.nxlink
+        _key = (id(_link), _link._change_count)
+        if self._entries is not None and self._entries_key == _key:
+            return self._entries
+        _linked_entries = _link.entries
         _entries = {}
         if self.is_external():
             for entry in _linked_entries:
@@ -5572,6 +5980,7 @@ class NXlinkgroup(NXlink, NXgroup):
         if _entries != self._entries:
             self._entries = _entries
             self.set_changed()
+        self._entries_key = (id(_link), _link._change_count)
         return _entries
 
 
@@ -5581,6 +5990,10 @@ class NXroot(NXgroup):
     This group has additional methods to lock or unlock the tree.
     """
 
+    _clsflags = _CLS_ROOT
+    _mtime_checked = None
+    _mtime_interval = 0.25
+
     def __init__(self, *args, **kwargs):
         self._class = 'NXroot'
         self._backup = None
@@ -5623,15 +6036,25 @@ class NXroot(NXgroup):
                 f"'{self.nxname}' has no associated file to reload")
 
     def is_modified(self):
-        """True if the NeXus file has been modified by an external process."""
+        """True if the NeXus file has been modified by an external process.
+
+        The file modification time is read at most once every
+        `_mtime_interval` seconds, unless the recorded modification time has
+        changed since the last check, *e.g.*, after the file is reloaded.
+        """
         if self._file is None:
             self._file_modified = False
         else:
-            _mtime = self._file.mtime
-            if self._mtime and _mtime > self._mtime:
-                self._file_modified = True
-            else:
-                self._file_modified = False
+            now = time.monotonic()
+            checked = self._mtime_checked
+            if (checked is None or checked[1] != self._mtime or
+                    now - checked[0] >= self._mtime_interval):
+                _mtime = self._file.mtime
+                if self._mtime and _mtime > self._mtime:
+                    self._file_modified = True
+                else:
+                    self._file_modified = False
+                self._mtime_checked = (now, self._mtime)
         return self._file_modified
 
     def lock(self):
@@ -5652,6 +6075,7 @@ class NXroot(NXgroup):
                     self._mode = self._file.mode = 'r'
                     raise NeXusError(
                         f"Not permitted to write to '{self._filename}'")
+                self._mtime_checked = None
                 if self.is_modified():
                     raise NeXusError("File modified. Reload before unlocking")
                 self._mode = self._file.mode = 'rw'
@@ -5679,7 +6103,6 @@ class NXroot(NXgroup):
         if filename is None:
             if dir is None:
                 dir = Path.cwd()
-            import tempfile
             prefix = Path(self.nxfilename).stem
             suffix = Path(self.nxfilename).suffix
             prefix = prefix + '_backup_'
@@ -5692,7 +6115,6 @@ class NXroot(NXgroup):
                     f"'{Path(filename).resolve()}' already exists")
             else:
                 backup = Path(filename).resolve()
-        import shutil
         shutil.copy2(self.nxfilename, backup)
         self._backup = backup
 
@@ -5716,7 +6138,6 @@ class NXroot(NXgroup):
             raise NeXusError(
                 f"To overwrite '{Path(filename).resolve()}', set 'overwite' "
                 "to True")
-        import shutil
         shutil.copy2(self._backup, filename)
         self.reload()
 
@@ -5751,17 +6172,13 @@ class NXroot(NXgroup):
         default = self.get_default()
         if default is not None:
             return default
-        elif self.NXdata:
-            return self.NXdata[0]
-        elif self.NXmonitor:
-            return self.NXmonitor[0]
-        elif self.NXlog:
-            return self.NXlog[0]
-        elif self.NXentry:
-            for entry in self.NXentry:
-                data = entry.plottable_data
-                if data is not None:
-                    return data
+        data = self._first_component('NXdata', 'NXmonitor', 'NXlog')
+        if data is not None:
+            return data
+        for entry in self.NXentry:
+            data = entry.plottable_data
+            if data is not None:
+                return data
         return None
 
     @property
@@ -5782,8 +6199,8 @@ class NXroot(NXgroup):
             with NXFile(self._filename, 'r') as f:
                 root = f.readfile()
             self._entries = root._entries
-            for entry in self._entries:
-                self._entries[entry]._group = self
+            for child in self._entries.values():
+                child._group = self
             self._attrs._setattrs(root.attrs)
             self._file = NXFile(self._filename, self._mode)
             self._mtime = self._file.mtime
@@ -5805,6 +6222,8 @@ class NXroot(NXgroup):
 class NXentry(NXgroup):
     """NXentry group, a subclass of the NXgroup class."""
 
+    _clsflags = _CLS_ENTRY
+
     def __init__(self, *args, **kwargs):
         self._class = 'NXentry'
         NXgroup.__init__(self, *args, **kwargs)
@@ -5835,7 +6254,8 @@ class NXentry(NXgroup):
                     result[name] = self[name] + other[name]
                 else:
                     raise KeyError
-            for name in [name for name in self if name not in names]:
+            data_names = set(names)
+            for name in [name for name in self if name not in data_names]:
                 result[name] = self[name]
             return result
         except KeyError:
@@ -5865,8 +6285,8 @@ class NXentry(NXgroup):
                     result[name] = self[name] - other[name]
                 else:
                     raise KeyError
-            for name in [name for name in self
-                         if not isinstance(self[name], NXdata)]:
+            data_names = set(names)
+            for name in [name for name in self if name not in data_names]:
                 result[name] = self[name]
             return result
         except KeyError:
@@ -5908,14 +6328,8 @@ class NXentry(NXgroup):
         default = self.get_default()
         if default is not None:
             return default
-        elif self.NXdata:
-            return self.NXdata[0]
-        elif self.NXmonitor:
-            return self.NXmonitor[0]
-        elif self.NXlog:
-            return self.NXlog[0]
         else:
-            return None
+            return self._first_component('NXdata', 'NXmonitor', 'NXlog')
 
 
 class NXsubentry(NXentry):
@@ -6023,6 +6437,7 @@ class NXdata(NXgroup):
         self._class = 'NXdata'
         NXgroup.__init__(self, *args, **kwargs)
         attrs = {}
+        entries = self.entries
         if axes is not None:
             if not is_iterable(axes):
                 axes = [axes]
@@ -6031,7 +6446,7 @@ class NXdata(NXgroup):
             for axis in axes:
                 i += 1
                 if isinstance(axis, NXfield) or isinstance(axis, NXlink):
-                    if axis.nxname == 'unknown' or axis.nxname in self:
+                    if axis.nxname == 'unknown' or axis.nxname in entries:
                         axis_name = f'axis{i}'
                     else:
                         axis_name = axis.nxname
@@ -6042,7 +6457,7 @@ class NXdata(NXgroup):
             attrs['axes'] = list(axis_names.values())
         if signal is not None:
             if isinstance(signal, NXfield) or isinstance(signal, NXlink):
-                if signal.nxname == 'unknown' or signal.nxname in self:
+                if signal.nxname == 'unknown' or signal.nxname in entries:
                     signal_name = 'signal'
                 else:
                     signal_name = signal.nxname
@@ -6102,34 +6517,32 @@ class NXdata(NXgroup):
             return NXgroup.__getitem__(self, key)
         elif self.nxsignal is not None:
             idx, axes = self.slab(key)
-            removed_axes = []
+            kept_axes, removed_axes = [], []
             for axis in axes:
-                if (axis.shape == () or axis.shape == (0,) or
-                        axis.shape == (1,)):
+                if axis.shape in ((), (0,), (1,)):
                     removed_axes.append(axis)
-            axes = [ax for ax in axes if ax not in [rax for rax in removed_axes
-                                                    if rax is ax]]
-            signal = self.nxsignal[idx]
-            if self.nxerrors:
-                errors = self.nxerrors[idx]
-            else:
-                errors = None
-            if self.nxweights:
-                weights = self.nxweights[idx]
-            else:
-                weights = None
+                else:
+                    kept_axes.append(axis)
+            nxsignal, errors, weights = (self.nxsignal, self.nxerrors,
+                                         self.nxweights)
+            signal = nxsignal[idx]
+            if errors is not None:
+                errors = errors[idx]
+            if weights is not None:
+                weights = weights[idx]
             if 'axes' in signal.attrs:
                 del signal.attrs['axes']
-            result = NXdata(signal, axes, errors, weights, *removed_axes)
+            result = NXdata(signal, kept_axes, errors, weights, *removed_axes)
             if errors is not None:
                 result.nxerrors = errors
             if weights is not None:
                 result.nxweights = weights
-            if self.nxsignal.mask is not None:
-                if isinstance(self.nxsignal.mask, NXfield):
-                    result[self.nxsignal.mask.nxname] = signal.mask
-            if self.nxtitle:
-                result.title = self.nxtitle
+            mask = nxsignal.mask
+            if isinstance(mask, NXfield):
+                result[mask.nxname] = signal.mask
+            title = self.nxtitle
+            if title:
+                result.title = title
             return result
         else:
             raise NeXusError("No signal specified")
@@ -6155,25 +6568,27 @@ class NXdata(NXgroup):
         if is_text(idx):
             NXgroup.__setitem__(self, idx, value)
         elif self.nxsignal is not None:
+            signal = self.nxsignal
             if isinstance(idx, numbers.Integral) or isinstance(idx, slice):
                 axis = self.nxaxes[0]
-                if self.nxsignal.shape[0] == axis.shape[0]:
+                if (is_real_slice(idx) and
+                        signal.shape[0] == axis.shape[0]):
                     axis = axis.boundaries()
                 idx = convert_index(idx, axis)
-                self.nxsignal[idx] = value
+                signal[idx] = value
             else:
                 slices = []
                 axes = self.nxaxes
                 for i, ind in enumerate(idx):
-                    if self.nxsignal.shape[i] == axes[i].shape[0]:
-                        axis = axes[i].boundaries()
-                    else:
-                        axis = axes[i]
+                    axis = axes[i]
+                    if (is_real_slice(ind) and
+                            signal.shape[i] == axis.shape[0]):
+                        axis = axis.boundaries()
                     ind = convert_index(ind, axis)
                     if isinstance(ind, slice) and ind.stop is not None:
                         ind = slice(ind.start, ind.stop-1, ind.step)
                     slices.append(ind)
-                self.nxsignal[tuple(slices)] = value
+                signal[tuple(slices)] = value
         else:
             raise NeXusError("Invalid index")
 
@@ -6196,6 +6611,33 @@ class NXdata(NXgroup):
             self.attrs['axes'] = [ax if ax != key else '.'
                                   for ax in _readaxes(self.attrs['axes'])]
 
+    def _copy_metadata(self, errors=True, weights=True):
+        """Return a copy of the group without the signal data.
+
+        This is used by arithmetic operations to avoid copying arrays that
+        are immediately replaced in the result.
+
+        Parameters
+        ----------
+        errors : bool, optional
+            True if the signal errors are also omitted, by default True.
+        weights : bool, optional
+            True if the signal weights are also omitted, by default True.
+
+        Returns
+        -------
+        NXdata
+            Copy of the group without the signal and, optionally, the
+            errors and weights that will be replaced.
+        """
+        signal = self.nxsignal
+        exclude = [signal.nxname]
+        if errors and self.nxerrors is not None:
+            exclude.append(signal.nxname+'_errors')
+        if weights and self.nxweights is not None:
+            exclude.append(signal.nxname+'_weights')
+        return self._deepcopy({}, exclude=exclude)
+
     def __add__(self, other):
         """Add the current data group to another NXdata group or an array.
 
@@ -6217,14 +6659,14 @@ class NXdata(NXgroup):
         NXdata
             NXdata group with the summed data.
         """
-        result = deepcopy(self)
         if isinstance(other, NXdata):
             if self.nxsignal and self.nxsignal.shape == other.nxsignal.shape:
+                result = self._copy_metadata()
                 result[self.nxsignal.nxname] = self.nxsignal + other.nxsignal
                 if self.nxerrors:
                     if other.nxerrors:
-                        result.nxerrors = np.sqrt(self.nxerrors**2 +
-                                                  other.nxerrors**2)
+                        result.nxerrors = np.hypot(self.nxerrors,
+                                                   other.nxerrors)
                     else:
                         result.nxerrors = self.nxerrors
                 if self.nxweights:
@@ -6236,6 +6678,7 @@ class NXdata(NXgroup):
         elif isinstance(other, NXgroup):
             raise NeXusError("Cannot add two arbitrary groups")
         else:
+            result = self._copy_metadata(errors=False, weights=False)
             result[self.nxsignal.nxname] = self.nxsignal + other
             return result
 
@@ -6259,14 +6702,14 @@ class NXdata(NXgroup):
         NXdata
             NXdata group containing the subtracted data.
         """
-        result = deepcopy(self)
         if isinstance(other, NXdata):
             if self.nxsignal and self.nxsignal.shape == other.nxsignal.shape:
+                result = self._copy_metadata()
                 result[self.nxsignal.nxname] = self.nxsignal - other.nxsignal
                 if self.nxerrors:
                     if other.nxerrors:
-                        result.nxerrors = np.sqrt(self.nxerrors**2 +
-                                                  other.nxerrors**2)
+                        result.nxerrors = np.hypot(self.nxerrors,
+                                                   other.nxerrors)
                     else:
                         result.nxerrors = self.nxerrors
                 if self.nxweights:
@@ -6278,6 +6721,7 @@ class NXdata(NXgroup):
         elif isinstance(other, NXgroup):
             raise NeXusError("Cannot subtract two arbitrary groups")
         else:
+            result = self._copy_metadata(errors=False, weights=False)
             result[self.nxsignal.nxname] = self.nxsignal - other
             return result
 
@@ -6301,17 +6745,17 @@ class NXdata(NXgroup):
         NXdata
             NXdata group with the multiplied data.
         """
-        result = deepcopy(self)
         if isinstance(other, NXdata):
             # error here signal not defined in this scope
             # if self.nxsignal and signal.shape == other.nxsignal.shape:
             if self.nxsignal and self.nxsignal.shape == other.nxsignal.shape:
+                result = self._copy_metadata()
                 result[self.nxsignal.nxname] = self.nxsignal * other.nxsignal
                 if self.nxerrors:
                     if other.nxerrors:
-                        result.nxerrors = np.sqrt(
-                                          (self.nxerrors * other.nxsignal)**2 +
-                                          (other.nxerrors * self.nxsignal)**2)
+                        result.nxerrors = np.hypot(
+                            self.nxerrors * other.nxsignal,
+                            other.nxerrors * self.nxsignal)
                     else:
                         result.nxerrors = self.nxerrors
                 if self.nxweights:
@@ -6323,6 +6767,7 @@ class NXdata(NXgroup):
         elif isinstance(other, NXgroup):
             raise NeXusError("Cannot multiply two arbitrary groups")
         else:
+            result = self._copy_metadata()
             result[self.nxsignal.nxname] = self.nxsignal * other
             if self.nxerrors:
                 result.nxerrors = self.nxerrors * other
@@ -6367,23 +6812,24 @@ class NXdata(NXgroup):
         NXdata
             NXdata group with the multiplied data.
         """
-        result = deepcopy(self)
         if isinstance(other, NXdata):
             if self.nxsignal and self.nxsignal.shape == other.nxsignal.shape:
+                result = self._copy_metadata(weights=False)
                 result[self.nxsignal.nxname] = self.nxsignal / other.nxsignal
                 if self.nxerrors:
                     if other.nxerrors:
-                        result.nxerrors = (
-                             np.sqrt(
-                                self.nxerrors ** 2 +
-                                (result[self.nxsignal.nxname] * other.nxerrors)
-                                ** 2) / other.nxsignal)
+                        ratio_errors = (result[self.nxsignal.nxname] *
+                                        other.nxerrors)
+                        result.nxerrors = (np.hypot(self.nxerrors,
+                                                    ratio_errors) /
+                                           other.nxsignal)
                     else:
                         result.nxerrors = self.nxerrors
                 return result
         elif isinstance(other, NXgroup):
             raise NeXusError("Cannot divide two arbitrary groups")
         else:
+            result = self._copy_metadata()
             result[self.nxsignal.nxname] = self.nxsignal / other
             if self.nxerrors:
                 result.nxerrors = self.nxerrors / other
@@ -6847,13 +7293,7 @@ class NXdata(NXgroup):
             kwargs['image'] = True
 
         # Plot with the available plotter
-        try:
-            from __main__ import plotview
-            if plotview is None:
-                raise ImportError
-        except ImportError:
-            from .plot import plotview
-
+        plotview = _getplotview()
         plotview.plot(self, fmt, xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax,
                       vmin=vmin, vmax=vmax, **kwargs)
 
@@ -6900,18 +7340,28 @@ class NXdata(NXgroup):
 
     @property
     def nxsignal(self):
-        """NXfield containing the signal data."""
+        """NXfield containing the signal data.
+
+        The signal is cached until the group is changed, unless it is
+        resolved from a link, whose target may be modified elsewhere.
+        """
+        if self._signal_cache is not None:
+            return self._signal_cache
+        signal = None
         if len(self) == 1 and self.NXfield:
-            return self.NXfield[0]
+            signal = self.NXfield[0]
         elif 'signal' in self.attrs and self.attrs['signal'] in self:
-            return self[self.attrs['signal']]
-        for obj in self.values():
-            if 'signal' in obj.attrs and text(obj.attrs['signal']) == '1':
-                if isinstance(self[obj.nxname], NXlink):
-                    return self[obj.nxname].nxlink
-                else:
-                    return self[obj.nxname]
-        return None
+            signal = self[self.attrs['signal']]
+        else:
+            for obj in self.values():
+                if 'signal' in obj.attrs and text(obj.attrs['signal']) == '1':
+                    if isinstance(obj, NXlink):
+                        return obj.nxlink
+                    signal = obj
+                    break
+        if not isinstance(self, NXlink):
+            self._signal_cache = signal
+        return signal
 
     @nxsignal.setter
     def nxsignal(self, signal):
@@ -7291,8 +7741,9 @@ def setconfig(**kwargs):
             raise NeXusError(f"'{parameter}' is not a valid parameter")
         if value == 'None':
             value = None
-        elif (parameter == 'lock' or parameter == 'lockexpiry' or
-              parameter == 'maxsize' or parameter == 'memory'):
+        elif (parameter == 'cache' or parameter == 'lock' or
+              parameter == 'lockexpiry' or parameter == 'maxsize' or
+              parameter == 'memory'):
             try:
                 value = int(value)
             except TypeError:
@@ -7327,6 +7778,27 @@ nxgetconfig = getconfig
 nxsetconfig = setconfig
 
 
+def getcache():
+    """Return the default size of the HDF5 chunk cache (in MB)."""
+    return NX_CONFIG['cache']
+
+
+def setcache(value):
+    """Set the default size of the HDF5 chunk cache (in MB).
+
+    If the value is set to 0, the h5py default is used.
+    """
+    global NX_CONFIG
+    try:
+        NX_CONFIG['cache'] = int(value)
+    except ValueError:
+        raise NeXusError("Invalid value for chunk cache size")
+
+
+nxgetcache = getcache
+nxsetcache = setcache
+
+
 def getcompression():
     """Return default compression filter."""
     return NX_CONFIG['compression']
@@ -104,6 +104,8 @@ def test_plottable_data_01(data):
     assert data.plot_rank == data.nxsignal.ndim
     assert data.plot_axes == data.nxaxes
     assert data.nxsignal.valid_axes(data.nxaxes)
+    assert not data.nxsignal.valid_axes(data.nxaxes[::-1])
+    assert not data.nxsignal.valid_axes(data.nxaxes[:2])
 
 
 def test_plottable_data_02(data2):
@@ -139,6 +141,25 @@ def test_rename(NXdata_from_empty_01):
     assert [axis.nxname for axis in data.nxaxes] == ["zz", "yy", "xx"]
 
 
+def test_signal_cache(data, v):
+
+    assert data.nxsignal is data["v"]
+    assert data.nxsignal is data["v"]
+
+    data["v"] = 3 * v
+
+    assert data.nxsignal is data["v"]
+
+    data["w"] = 2 * v
+    data.nxsignal = "w"
+
+    assert data.nxsignal is data["w"]
+
+    del data["w"]
+
+    assert data.nxsignal is None
+
+
 def test_size_one_axis(x, z):
 
     y1 = np.array((1), dtype=np.float64)
@@ -214,6 +235,16 @@ def test_data_errors():
     assert np.array_equal(new_data.nxerrors, e1 * np.sqrt(1.25))
 
 
+def test_data_summed_errors(v):
+
+    data = NXdata(v, errors=np.sqrt(v))
+
+    for axis in (0, 2, (0, 1)):
+        summed_data = data.sum(axis)
+        assert np.allclose(summed_data.nxerrors,
+                           np.sqrt(v.nxvalue.sum(axis)))
+
+
 def test_data_weights():
 
     y1 = NXfield(np.linspace(1, 10, 10), name="y")
@@ -247,6 +278,33 @@ def test_data_weights():
 
     assert np.array_equal(new_data.nxweights, w1/2)
 
+    data = NXdata(v1, (y1), errors=y1, weights=w1)
+    new_data = data + 1
+
+    assert np.array_equal(new_data.nxerrors, y1)
+    assert np.array_equal(new_data.nxweights, w1)
+    assert new_data.nxaxes == data.nxaxes
+
+    new_data = data / data
+
+    assert np.array_equal(new_data.nxweights, w1)
+
+
+def test_data_assignment():
+
+    x = NXfield(np.arange(10.0), name="x")
+    y = NXfield(np.arange(4.0), name="y")
+    data = NXdata(NXfield(np.zeros((4, 10)), name="v"), (y, x))
+
+    data[1] = 1
+    data[0, 7] = 2
+    data[3, 2.0:4.0] = 3
+
+    assert np.all(data.nxsignal[1] == 1)
+    assert data.nxsignal[0, 7] == 2
+    assert np.array_equal(data.nxsignal[3, 1:6], [0, 3, 3, 3, 0])
+    assert data.nxsignal.sum() == 21
+
 
 def test_data_angles(data):
 
@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from nexusformat.nexus.tree import NXdata, NXentry, NXsample
+from nexusformat.nexus.tree import NXdata, NXentry, NXlog, NXsample
 
 
 @pytest.fixture
@@ -55,3 +55,15 @@ def test_plottable_data(entry_2):
 
     assert entry_2.is_plottable()
     assert entry_2.plottable_data is entry_2['d1']
+
+
+def test_plottable_data_order(v):
+
+    entry = NXentry(NXlog(name='l1'), NXdata(v, name='d10'),
+                    NXdata(v, name='d2'))
+
+    assert entry.plottable_data is entry['d2']
+
+    del entry['d2'], entry['d10']
+
+    assert entry.plottable_data is entry['l1']
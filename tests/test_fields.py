@@ -1,7 +1,7 @@
 import h5py as h5
 import numpy as np
 import pytest
-from nexusformat.nexus.tree import NXfield, nxgetconfig
+from nexusformat.nexus.tree import NXdata, NXfield, NXgroup, nxgetconfig
 
 
 @pytest.fixture
@@ -94,6 +94,59 @@ def test_field_methods(arr, request):
     assert field.average(keepdims=True) == np.average(arr, keepdims=True)
 
 
+def test_field_dir():
+
+    field = NXfield((1, 2), name="f1", attrs={"units": "mm", "sum": 1})
+
+    assert "units" in dir(field)
+    assert "nxname" in dir(field)
+    assert "_value" not in dir(field)
+    assert dir(field).count("sum") == 1
+    assert len(field.__dir__()) == len(set(field.__dir__()))
+
+
+def test_field_extrema():
+
+    field = NXfield([[1.0, np.nan, -np.inf], [np.inf, 5.0, 2.0]])
+
+    assert field.min() == 1.0
+    assert field.max() == 5.0
+    assert np.array_equal(field.min(axis=1), [1.0, 2.0])
+    assert np.array_equal(field.max(axis=0), [1.0, 5.0, 2.0])
+
+
+def test_masked_field_extrema():
+
+    field = NXfield(np.ma.array([1.0, -np.inf, 3.0, 5.0],
+                                mask=[True, False, False, True]))
+
+    assert field.min() == 3.0
+    assert field.max() == 3.0
+
+
+@pytest.mark.parametrize("arr", [[], [np.nan, np.nan]])
+def test_field_empty_extrema(arr):
+
+    field = NXfield(np.array(arr, dtype=np.float64))
+
+    with pytest.raises(ValueError):
+        field.min()
+    with pytest.raises(ValueError):
+        field.max()
+
+
+def test_field_nan_extrema():
+
+    field = NXfield([[np.nan, np.nan], [1.0, 2.0]])
+
+    with pytest.warns(RuntimeWarning):
+        assert np.array_equal(field.min(axis=1), [np.nan, 1.0],
+                              equal_nan=True)
+    with pytest.warns(RuntimeWarning):
+        assert np.array_equal(field.max(axis=1), [np.nan, 2.0],
+                              equal_nan=True)
+
+
 @pytest.mark.parametrize(
     "arr,idx", [("arr1D", np.s_[2:5]),
                 ("arr2D", np.s_[2:5, 2:5]),
@@ -107,6 +160,17 @@ def test_field_slice(arr, idx, request):
     assert field[idx].shape == arr[idx].shape
 
 
+@pytest.mark.parametrize("arr", ["arr1D", "arr2D", "arr3D"])
+def test_field_full_slice(arr, request):
+
+    arr = request.getfixturevalue(arr)
+    field = NXfield(arr)
+
+    assert np.array_equal(field[()].nxvalue, arr)
+    assert np.array_equal(field[...].nxvalue, arr)
+    assert field[...].shape == arr.shape
+
+
 def test_field_index(arr1D):
 
     field = NXfield(2*arr1D)
@@ -124,6 +188,18 @@ def test_field_index(arr1D):
     assert field.index(12., max=True) == 94
 
 
+def test_field_axes(arr1D, arr2D):
+
+    group = NXgroup(NXfield(arr1D, name="f1"))
+
+    assert [axis.nxname for axis in group["f1"].nxaxes] == ["Axis0"]
+
+    x, y = NXfield(np.arange(5), name="x"), NXfield(np.arange(4), name="y")
+    data = NXdata(NXfield(arr2D, name="f2"), (x, y))
+
+    assert [axis.nxname for axis in data["f2"].nxaxes] == ["Axis0", "y"]
+
+
 def test_field_resize(field):
 
     field[9] = 1
@@ -143,6 +219,11 @@ def test_field_resize(field):
     assert field.shape == (15, 5, 10)
     assert field[:, :, 9].sum() == 75
 
+    value = field.nxvalue
+    field.resize([15, 5, 10])
+
+    assert field.nxvalue is value
+
 
 def test_field_printing(arr1D):
 
@@ -1,8 +1,11 @@
 import os
+from copy import deepcopy
 
+import numpy as np
 import pytest
-from nexusformat.nexus.tree import (NXdata, NXentry, NXFile, NXroot, nxload,
-                                    nxopen)
+from nexusformat.nexus.tree import (NXdata, NXentry, NXfield, NXFile, NXgroup,
+                                    NXroot, nxgetcache, nxgetmemory, nxload,
+                                    nxopen, nxsetmemory)
 
 
 def test_file_creation(tmpdir):
@@ -80,3 +83,175 @@ def test_file_context_manager(tmpdir, field1, field2):
     assert "entry/data/f2" in w2
     assert "signal" in w2["entry/data"].attrs
     assert "axes" in w2["entry/data"].attrs
+
+
+def test_file_chunk_cache(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    cache = nxgetcache()
+    with NXFile(filename, "r") as f:
+        nslots, nbytes = f.file.id.get_access_plist().get_cache()[1:3]
+    assert nbytes == cache * 1024 * 1024
+    assert nslots == 100003
+
+    with NXFile(filename, "r", rdcc_nbytes=2*1024*1024) as f:
+        nbytes = f.file.id.get_access_plist().get_cache()[2]
+    assert nbytes == 2 * 1024 * 1024
+
+
+def test_file_attrs_update(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    w1["entry/data"].attrs.update({"a": "b", "c": 1})
+
+    assert w1["entry/data"].attrs["a"] == "b"
+
+    w2 = nxload(filename)
+    assert w2["entry/data"].attrs["a"] == "b"
+    assert w2["entry/data"].attrs["c"] == 1
+    assert "signal" in w2["entry/data"].attrs
+
+
+def test_file_dataset_cache(tmpdir):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(NXfield(np.arange(200000.0), name="f1"))
+    w1.save(filename)
+
+    memory = nxgetmemory()
+    nxsetmemory(1)
+    try:
+        w2 = nxload(filename)
+        field = w2["entry/data/f1"]
+        with w2.nxfile:
+            assert field[1] == 1.0
+            assert field[2] == 2.0
+
+        w1["entry/data/f1"][2] = 5.0
+
+        assert field[2] == 5.0
+    finally:
+        nxsetmemory(memory)
+
+
+def test_file_field_options(tmpdir, arr1D):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(arr1D, name="data")
+    w1["entry/data/signal"].compression = "lzf"
+    w1["entry/data/signal"].chunks = (11,)
+    w1.save(filename)
+
+    w2 = nxload(filename)
+    field = w2["entry/data/signal"]
+    assert field.compression == "lzf"
+    assert field.chunks == (11,)
+    assert field.maxshape == arr1D.shape
+
+
+def test_file_recreated_options(tmpdir, arr1D):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(arr1D, name="data")
+    w1["entry/data/signal"].compression = "lzf"
+    w1.save(filename)
+
+    w2 = nxload(filename, "rw")
+    field = w2["entry/data/signal"]
+    assert field.compression == "lzf"
+
+    with w2.nxfile as f:
+        del f.file["entry/data/signal"]
+        f.file["entry/data"].create_dataset("signal", data=arr1D,
+                                            compression="gzip")
+    field[0] = 1.0
+
+    assert field.compression == "gzip"
+
+
+def test_file_batch_delete(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    with w1.nxfile as f:
+        for name in ("f1", "f2"):
+            del w1["entry/data"][name]
+        assert f.is_open()
+
+    assert not w1.nxfile.is_open()
+
+    w2 = nxload(filename)
+    assert "entry/data" in w2
+    assert "entry/data/f1" not in w2
+    assert "entry/data/f2" not in w2
+
+
+def test_file_uncopied_data(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    w2 = nxload(filename)
+    w2["entry/data/f1"]._value = None
+    group = NXgroup()
+    group["data"] = w2["entry/data"]
+
+    assert group["data/f1"][1] == 2
+
+
+def test_file_copied_uncopied_data(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    w2 = nxload(filename)
+    w2["entry/data/f1"]._value = None
+    other_data = deepcopy(w2["entry/data"])
+    group = NXgroup(data=deepcopy(w2["entry/data"]))
+    w2.close()
+
+    assert group["data/f1"][1] == 2
+    assert other_data["f1"][1] == 2
+
+
+def test_file_modified(tmpdir, field1, field2):
+
+    filename = os.path.join(tmpdir, "file.nxs")
+    w1 = NXroot(NXentry())
+    w1.entry.data = NXdata(field1, field2)
+    w1.save(filename)
+
+    w1._mtime_interval = 3600
+
+    assert not w1.is_modified()
+
+    mtime = os.path.getmtime(filename) + 10
+    os.utime(filename, (mtime, mtime))
+
+    assert not w1.is_modified()
+
+    w1._mtime_interval = 0
+
+    assert w1.is_modified()
+
+    w1.reload()
+
+    assert not w1.is_modified()
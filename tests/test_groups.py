@@ -1,4 +1,5 @@
 import os
+import pickle
 
 from nexusformat.nexus.tree import NXdata, NXentry, NXgroup, NXlink, NXroot
 
@@ -74,6 +75,39 @@ def test_group_attrs():
 
     assert group1.attrs["a"] == "b"
     assert group1.attrs["c"] == 1
+    assert group1.attrs.sorted_keys() == ["a", "c"]
+
+    group1.attrs["b"] = 2
+
+    assert group1.attrs.sorted_keys() == ["a", "b", "c"]
+
+
+def test_group_membership(field1, field2):
+
+    group = NXgroup(field1)
+
+    assert field1 in group
+    assert field2 not in group
+
+    copied_group = NXgroup(field1)
+
+    assert field1 not in copied_group
+    assert copied_group["f1"] in copied_group
+
+
+def test_group_dir(field1):
+
+    group = NXgroup(field1, sum=field1, attrs={"a": "b", "f1": 1})
+
+    assert "f1" in dir(group)
+    assert "a" in dir(group)
+    assert "nxclass" in dir(group)
+    assert len(group.__dir__()) == len(set(group.__dir__()))
+
+    group["f10"] = field1
+    group["f9"] = field1
+
+    assert group.__dir__().index("f9") < group.__dir__().index("f10")
 
 
 def test_group_insertion(field2):
@@ -135,6 +169,68 @@ def test_group_title():
     assert group.nxtitle == "Group Title"
 
 
+def test_group_tree(field1, field2):
+
+    root = NXroot(NXentry(NXdata(field1, field2)))
+    tree = root.tree
+    root.set_unchanged(recursive=True)
+
+    assert root.tree == tree
+
+    root["entry/data/f1"].attrs["units"] = "mm"
+
+    assert root.changed
+    assert "@units = 'mm'" in root.tree
+    assert "@units = 'mm'" not in tree
+
+
+def test_group_sorted_names(field1, field2, field3):
+
+    group = NXgroup(f10=field1, f9=field2)
+
+    assert [f.nxname for f in group.component("NXfield")] == ["f9", "f10"]
+
+    group["f1"] = field3
+
+    assert ([f.nxname for f in group.component("NXfield")] ==
+            ["f1", "f9", "f10"])
+
+    group["f9"].rename("f11")
+    del group["f1"]
+
+    assert [f.nxname for f in group.component("NXfield")] == ["f10", "f11"]
+    assert group.tree.index("f10") < group.tree.index("f11")
+
+
+def test_group_signals(field1, field2):
+
+    group = NXgroup(field1, field2)
+    group["f1"].attrs["signal"] = 1
+
+    assert group.signals() == {1: group["f1"]}
+    assert group.signals() == {1: group["f1"]}
+
+    group["f2"].attrs["signal"] = 2
+
+    assert group.signals() == {1: group["f1"], 2: group["f2"]}
+
+    del group["f1"]
+
+    assert group.signals() == {2: group["f2"]}
+
+
+def test_group_pickle(field1, field2):
+
+    root = NXroot(NXentry(NXdata(field1, field2)))
+    root["entry/data/f1"].attrs["units"] = "mm"
+
+    copied_root = pickle.loads(pickle.dumps(root))
+
+    assert copied_root.tree == root.tree
+    assert copied_root["entry/data"].nxsignal.nxname == "f1"
+    assert copied_root["entry/data/f1"].attrs["units"] == "mm"
+
+
 def test_group_move(field1):
 
     group = NXentry()
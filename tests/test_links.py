@@ -104,6 +104,25 @@ def test_linkgroup_properties(tmpdir, field1a, save):
     assert root["entry/g2_link"].nxlink.entries == root["entry/g1/g2"].entries
 
 
+def test_linkgroup_entries(field1a, field2a):
+
+    root = NXroot(NXentry())
+    root["entry/g1"] = NXgroup(field1a)
+    root["entry/g1_link"] = NXlink("entry/g1")
+    entries = root["entry/g1_link"].entries
+
+    assert root["entry/g1_link"].entries is entries
+
+    root["entry/g1/f2"] = field2a
+
+    assert "f2" in root["entry/g1_link"].entries
+    assert root["entry/g1_link"].entries is not entries
+
+    root["entry/g1/f1"][0] = 5
+
+    assert root["entry/g1_link/f1"][0] == 5
+
+
 @pytest.mark.parametrize("save", ["False", "True"])
 def test_embedded_links(tmpdir, save, field1a, field2a):
 
@@ -210,6 +229,43 @@ def test_external_group_links(tmpdir, field1a, save):
     assert "units" in root["entry/g1_link/f1"].attrs
 
 
+def test_missing_external_group(tmpdir, field1a):
+
+    external_filename = os.path.join(tmpdir, "file2.nxs")
+    external_root = NXroot(NXentry(NXgroup(field1a, name='g1')))
+    external_root.save(external_filename, mode="w")
+
+    root = NXroot(NXentry())
+    root["entry/g1_link"] = NXlink(target="/entry/g1", file=external_filename)
+    link = root["entry/g1_link"]
+
+    assert "f1" in link
+
+    os.remove(external_filename)
+    link._link = link._entries = None
+
+    assert link._str_tree() == (
+        f"g1_link:NXgroup -> {external_filename}['/entry/g1']")
+
+
+def test_missing_external_group_path(tmpdir, field1a):
+
+    external_filename = os.path.join(tmpdir, "file2.nxs")
+    external_root = NXroot(NXentry(NXgroup(field1a, name='g1')))
+    external_root.save(external_filename, mode="w")
+
+    root = NXroot(NXentry())
+    root["entry/g1_link"] = NXlink(target="/entry/g1", file=external_filename)
+    link = root["entry/g1_link"]
+
+    assert "f1" in link
+
+    del external_root["entry/g1"]
+    link._link = link._entries = None
+
+    assert link._str_tree() == (
+        f"g1_link:NXgroup -> {external_filename}['/entry/g1']")
+
 def test_external_group_files(tmpdir, field1a):
 
     nxsetlock(10)